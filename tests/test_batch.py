@@ -1,11 +1,21 @@
 from __future__ import annotations
 
+import os
+import struct
 from pathlib import Path
 
+import pytest
 from PIL import Image
 
-from validator.core.batch import scan_folder
-from validator.core.autofix import plan_renames, apply_renames
+from validator.core.batch import (
+    has_texture_ext,
+    iter_texture_files,
+    iter_texture_files_concurrent,
+    revalidate_scan,
+    scan_folder,
+    update_scan_after_renames,
+)
+from validator.core.autofix import plan_renames, apply_renames, prime_taken_names
 from validator.profiles import get_profile
 
 
@@ -73,3 +83,432 @@ def test_autofix_never_overwrites(tmp_path: Path) -> None:
     applied, errors = apply_renames(actions)
 
     assert len(errors) == 0
+
+
+def test_has_texture_ext_is_case_insensitive(tmp_path: Path) -> None:
+    textures = ("a.png", "A.PNG", "a.Png", "a.TiFf", "b.v001.JPEG", "c.exr")
+    others = ("notes.txt", "a.png.bak", "png", "a.pn", "a.tga")
+    for name in textures:
+        assert has_texture_ext(name), name
+    for name in others:
+        assert not has_texture_ext(name), name
+
+    # The walker's cased-suffix fast path gives the same answers
+    for i, name in enumerate(textures + others):
+        (tmp_path / str(i)).mkdir()
+        (tmp_path / str(i) / name).write_bytes(b"")
+    assert sorted(rel.partition("/")[2] for _, rel, _, _ in iter_texture_files(tmp_path)) == sorted(textures)
+
+
+def test_iter_texture_files_recurses_and_filters(tmp_path: Path) -> None:
+    export_dir = tmp_path / "exports"
+    write_png(export_dir / "CrateA_BaseColor.png")
+    write_png(export_dir / "sub" / "deeper" / "CrateA_Normal.PNG")
+    (export_dir / "notes.txt").write_text("not a texture", encoding="utf-8")
+    (export_dir / "sub" / ".png").write_text("hidden, no stem", encoding="utf-8")
+
+    found = sorted(rel for _, rel, _, _ in iter_texture_files(export_dir))
+
+    assert found == ["CrateA_BaseColor.png", "sub/deeper/CrateA_Normal.PNG"]
+    # Lowered extensions share one string object
+    exts = [ext for _, _, _, ext in iter_texture_files(export_dir)]
+    assert exts == [".png", ".png"] and exts[0] is exts[1]
+
+
+def test_iter_texture_files_skips_symlinked_dirs_but_follows_file_links(tmp_path: Path) -> None:
+    outside = tmp_path / "outside"
+    write_png(outside / "CrateB_BaseColor.png")
+    export_dir = tmp_path / "exports"
+    write_png(export_dir / "CrateA_BaseColor.png")
+    try:
+        (export_dir / "link").symlink_to(outside, target_is_directory=True)
+        (export_dir / "CrateB_BaseColor.png").symlink_to(outside / "CrateB_BaseColor.png")
+        (export_dir / "CrateC_BaseColor.png").symlink_to(outside / "gone.png")
+        (export_dir / "Dir_Normal.png").symlink_to(outside, target_is_directory=True)
+    except OSError:
+        pytest.skip("symlinks not available")
+
+    # Linked files are textures; linked dirs (whatever their name) and
+    # dangling links are not, the same as the rglob walk this replaced
+    assert [rel for _, rel, _, _ in iter_texture_files(export_dir)] == ["CrateA_BaseColor.png", "CrateB_BaseColor.png"]
+
+
+def test_iter_texture_files_skips_tool_hidden_and_report_dirs(tmp_path: Path) -> None:
+    export_dir = tmp_path / "exports"
+    write_png(export_dir / "CrateA_BaseColor.png")
+    write_png(export_dir / ".git" / "CrateB_BaseColor.png")
+    write_png(export_dir / "reports" / "CrateE_BaseColor.png")
+    write_png(export_dir / "sub" / "reports" / "CrateC_BaseColor.png")
+    write_png(export_dir / ".thumbs" / "CrateD_BaseColor.png")
+
+    # Only the root's reports/ (the export folder) is skipped; a texture
+    # folder of that name deeper in the pack is scanned
+    assert [rel for _, rel, _, _ in iter_texture_files(export_dir)] == [
+        "CrateA_BaseColor.png",
+        "sub/reports/CrateC_BaseColor.png",
+    ]
+    assert list(iter_texture_files_concurrent(export_dir)) == list(iter_texture_files(export_dir))
+    found = [
+        rel
+        for _, rel, _, _ in iter_texture_files(
+            export_dir, skip_dirs=frozenset(), skip_hidden=False, skip_root_dirs=frozenset()
+        )
+    ]
+    assert found == [
+        ".git/CrateB_BaseColor.png",
+        ".thumbs/CrateD_BaseColor.png",
+        "CrateA_BaseColor.png",
+        "reports/CrateE_BaseColor.png",
+        "sub/reports/CrateC_BaseColor.png",
+    ]
+
+
+def test_iter_texture_files_concurrent_matches_sequential_walk(tmp_path: Path) -> None:
+    export_dir = tmp_path / "exports"
+    for rel in ("b/Crate_Normal.png", "A/z/Crate_BaseColor.png", "a_Top_ORM.png", ".hidden/X_Normal.png", "c/d/e/Y_Height.TIF"):
+        write_png(export_dir / rel)
+
+    sequential = list(iter_texture_files(export_dir))
+    errors = []
+    assert list(iter_texture_files_concurrent(export_dir, max_workers=4, errors=errors)) == sequential
+    assert errors == []
+
+    missing = tmp_path / "missing"
+    assert list(iter_texture_files_concurrent(missing, errors=errors)) == []
+    assert [path for path, _ in errors] == [str(missing)]
+
+
+def test_scan_folder_records_unreadable_dirs_and_continues(tmp_path: Path) -> None:
+    export_dir = tmp_path / "exports"
+    write_png(export_dir / "CrateA_BaseColor.png")
+    locked = export_dir / "locked"
+    write_png(locked / "CrateB_BaseColor.png")
+    locked.chmod(0)
+    try:
+        if os.access(locked, os.R_OK):
+            pytest.skip("permissions not enforced (e.g. running as root)")
+        groups, _, _, summary = scan_folder(export_dir, get_profile("Unity"))
+    finally:
+        locked.chmod(0o755)
+
+    assert list(groups) == ["CrateA"]
+    assert [path for path, _ in summary.walk_errors] == [str(locked)]
+
+
+def test_plan_renames_picks_distinct_targets(tmp_path: Path) -> None:
+    export_dir = tmp_path / "exports"
+    write_png(export_dir / "CrateA_BaseColor_v001.png")
+    write_png(export_dir / "CrateA_BaseColor_v002.png")
+
+    profile = get_profile("Unity")
+    groups, _, _, _ = scan_folder(export_dir, profile)
+
+    actions = plan_renames(groups["CrateA"])
+    dst_names = sorted(a.dst.name for a in actions)
+
+    assert dst_names == ["CrateA_BaseColor.png", "CrateA_BaseColor_fixed1.png"]
+
+    applied, errors = apply_renames(actions)
+    assert not errors
+    assert sorted(p.name for p in export_dir.iterdir()) == dst_names
+
+
+def test_apply_renames_never_replaces_a_target_that_appears_late(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    export_dir = tmp_path / "exports"
+    write_png(export_dir / "CrateA_BaseColor_v001.png")
+    groups, _, _, _ = scan_folder(export_dir, get_profile("Unity"))
+    actions = plan_renames(groups["CrateA"])
+
+    # Another process writes the target after planning, and the existence
+    # check misses it
+    (export_dir / "CrateA_BaseColor.png").write_bytes(b"someone else's file")
+    monkeypatch.setattr("validator.core.autofix.os.path.lexists", lambda p: False)
+
+    applied, errors = apply_renames(actions)
+    assert not errors
+    assert [a.dst.name for a in applied] == ["CrateA_BaseColor_fixed1.png"]
+    assert (export_dir / "CrateA_BaseColor.png").read_bytes() == b"someone else's file"
+    assert sorted(p.name for p in export_dir.iterdir()) == ["CrateA_BaseColor.png", "CrateA_BaseColor_fixed1.png"]
+
+
+def test_prime_taken_names_keeps_plans_unchanged(tmp_path: Path) -> None:
+    export_dir = tmp_path / "exports"
+    for sub in ("a", "b"):
+        write_png(export_dir / sub / "CrateA_BaseColor.png")
+        write_png(export_dir / sub / "CrateA_albedo_v002.png")
+        write_png(export_dir / sub / "CrateB_nrm.png")
+
+    groups, _, _, _ = scan_folder(export_dir, get_profile("Unity"))
+
+    lazy: dict = {}
+    expected = [a for g in groups.values() for a in plan_renames(g, lazy)]
+    primed: dict = {}
+    prime_taken_names(groups.values(), primed)
+    assert set(primed) == {export_dir / "a", export_dir / "b"}
+    assert [a for g in groups.values() for a in plan_renames(g, primed)] == expected
+
+
+def test_iter_texture_files_yields_sorted_rel_paths(tmp_path: Path) -> None:
+    export_dir = tmp_path / "exports"
+    for rel in ["b_Normal.png", "A_Normal.png", "a/z_Normal.png", "a.x_Normal.png", "a-b_Normal.png", "a/B/c_ORM.png"]:
+        write_png(export_dir / rel)
+
+    found = [rel for _, rel, _, _ in iter_texture_files(export_dir)]
+
+    assert found == sorted(found, key=str.lower)
+
+
+def test_read_image_info_header_fast_path_matches_pillow(tmp_path: Path) -> None:
+    from validator.util.image_info import read_image_info
+
+    cases = [
+        ("a.png", "RGBA"),
+        ("b.png", "L"),
+        ("c.jpg", "RGB"),
+        ("d.jpg", "L"),
+        ("e.png", "P"),
+        ("e1.png", "1"),
+        ("f.tif", "RGB"),
+        ("g.tif", "RGBA"),
+        ("h.tif", "LA"),
+        ("i.tif", "I;16"),
+    ]
+    for name, mode in cases:
+        path = tmp_path / name
+        write_png(path, size=(37, 19), mode=mode)
+
+        info, err = read_image_info(path)
+        assert err is None
+        with Image.open(path) as img:
+            assert (info.width, info.height) == img.size
+            assert info.mode == img.mode
+            assert info.format == img.format
+            assert info.channels == len(img.getbands())
+
+
+def test_read_image_info_reports_empty_and_truncated_files(tmp_path: Path) -> None:
+    from validator.util.image_info import read_image_info
+
+    (tmp_path / "empty.png").write_bytes(b"")
+    (tmp_path / "short.png").write_bytes(b"\x89PNG")
+
+    assert read_image_info(tmp_path / "empty.png") == (None, "Empty file (0 bytes).")
+    assert read_image_info(tmp_path / "short.png") == (None, "Truncated file (4 bytes).")
+
+
+def test_read_image_info_skips_jpeg_fill_bytes(tmp_path: Path) -> None:
+    from validator.util.image_info import _read_header_info, read_image_info
+
+    path = tmp_path / "Crate_BaseColor.jpg"
+    Image.new("RGB", (12, 7)).save(path)
+    data = path.read_bytes()
+    sof = data.index(b"\xff\xc0")
+    path.write_bytes(data[:sof] + b"\xff" + data[sof:])  # one fill byte
+
+    info = _read_header_info(path)
+    assert info is not None
+    assert info == read_image_info(path)[0]
+    assert (info.width, info.height, info.mode) == (12, 7, "RGB")
+
+
+def test_read_image_info_parses_exr_header(tmp_path: Path) -> None:
+    from validator.util.image_info import _read_header_info, read_image_info
+
+    def attr(name: bytes, typ: bytes, value: bytes) -> bytes:
+        return name + b"\0" + typ + b"\0" + struct.pack("<i", len(value)) + value
+
+    channels = b"".join(c + b"\0" + struct.pack("<iB3xii", 1, 0, 1, 1) for c in (b"A", b"B", b"G", b"R")) + b"\0"
+    header = (
+        b"\x76\x2f\x31\x01" + struct.pack("<I", 2)
+        + attr(b"channels", b"chlist", channels)
+        + attr(b"compression", b"compression", b"\0")
+        + attr(b"dataWindow", b"box2i", struct.pack("<iiii", 0, 0, 2047, 1023))
+        + b"\0"
+    )
+    path = tmp_path / "Crate_Height.exr"
+    path.write_bytes(header)
+
+    info, err = read_image_info(path)
+    assert err is None
+    assert (info.width, info.height, info.mode, info.format, info.channels, info.has_alpha) == (
+        2048, 1024, "RGBA", "EXR", 4, True,
+    )
+
+    # Corrupt or truncated attribute sizes fall back instead of over-reading
+    for size in (0xFFFFFFF0, len(channels) + 1):
+        bad = header.replace(struct.pack("<i", len(channels)), struct.pack("<I", size), 1)
+        path.write_bytes(bad[:bad.index(b"compression")])
+        assert _read_header_info(path) is None
+
+
+def test_read_image_info_batch_keeps_input_order(tmp_path: Path) -> None:
+    from validator.util.image_info import read_image_info, read_image_info_batch
+
+    paths = []
+    for i, mode in enumerate(("RGB", "L", "RGBA", "LA")):
+        path = tmp_path / f"t{i}.png"
+        write_png(path, size=(8 + i, 4), mode=mode)
+        paths.append(path)
+    paths.append(tmp_path / "missing.png")
+
+    assert read_image_info_batch(paths, max_workers=3) == [read_image_info(p) for p in paths]
+    assert read_image_info_batch([]) == []
+
+
+def test_scan_folder_on_network_share_matches_local_scan(tmp_path: Path, monkeypatch) -> None:
+    export_dir = tmp_path / "exports"
+    write_png(export_dir / "CrateA_BaseColor.png")
+    write_png(export_dir / "sub" / "CrateA_Normal.png", size=(3, 3))
+    write_png(export_dir / "CrateB_ORM.png", mode="L")
+    profile = get_profile("Unreal")
+
+    _, _, local_results, local_summary = scan_folder(export_dir, profile)
+    monkeypatch.setattr("validator.core.batch.is_network_path", lambda path: True)
+    groups, _, results, summary = scan_folder(export_dir, profile)
+
+    assert results == local_results
+    assert summary == local_summary
+    assert all(g.image_infos for g in groups.values())
+
+
+def test_update_scan_after_renames_matches_rescan(tmp_path: Path) -> None:
+    export_dir = tmp_path / "exports"
+    write_png(export_dir / "Zed_BaseColor.png")
+    write_png(export_dir / "a" / "Crate_albedo_v002.png")
+    write_png(export_dir / "a" / "Crate_nrm.png", mode="RGBA")
+    write_png(export_dir / "b" / "Barrel_rma.png")
+    write_png(export_dir / "b" / "Barrel_Normal.png")
+    write_png(export_dir / "junk.png")
+
+    profile = get_profile("Unreal")
+    first = scan_folder(export_dir, profile)
+    actions = [a for g in first[0].values() for a in plan_renames(g)]
+    applied, errors = apply_renames(actions)
+    assert applied and not errors
+
+    updated = update_scan_after_renames(first, applied, profile)
+    assert updated == scan_folder(export_dir, profile)
+
+
+def test_update_scan_after_renames_moves_suffixed_names_to_unparsed(tmp_path: Path) -> None:
+    export_dir = tmp_path / "exports"
+    write_png(export_dir / "CrateA_BaseColor.png")
+    write_png(export_dir / "CrateA_albedo.png")
+    write_png(export_dir / "Solo_diffuse.png")
+    (export_dir / "Solo_BaseColor.png").mkdir()  # name taken, not a texture
+
+    profile = get_profile("Unity")
+    first = scan_folder(export_dir, profile)
+    actions = [a for g in first[0].values() for a in plan_renames(g)]
+    applied, _ = apply_renames(actions)
+
+    # CrateA_BaseColor_fixed1.png no longer parses; Solo loses its only texture
+    updated = update_scan_after_renames(first, applied, profile)
+    assert updated == scan_folder(export_dir, profile)
+    assert "Solo" not in updated[0]
+
+
+def test_revalidate_scan_matches_fresh_scan_without_reading_files(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    export_dir = tmp_path / "exports"
+    write_png(export_dir / "CrateA_BaseColor.png")
+    write_png(export_dir / "CrateA_Normal.png", size=(3, 4))
+    write_png(export_dir / "CrateA_Roughness.png")
+    write_png(export_dir / "CrateB_ORM.png", mode="RGBA")
+    (export_dir / "CrateB_Height.exr").write_bytes(b"not an image")
+
+    first = scan_folder(export_dir, get_profile("Unreal"))
+    expected = scan_folder(export_dir, get_profile("VFX"))
+
+    def no_reads(path):
+        raise AssertionError(f"unexpected read of {path}")
+
+    monkeypatch.setattr("validator.core.batch.read_image_info_cached", no_reads)
+    monkeypatch.setattr("validator.core.batch.check_orm_texture", no_reads)
+    assert revalidate_scan(first, get_profile("VFX")) == expected
+
+
+def test_orm_check_sees_sparse_detail_missed_by_the_thumbnail(tmp_path: Path) -> None:
+    from PIL import ImageDraw
+
+    from validator.core.orm_validation import check_orm_texture
+    from validator.util.image_info import read_image_info
+
+    # Thin metallic trim: 2px lines every 64px in B, which the sampled
+    # thumbnail steps over
+    img = Image.new("RGB", (2048, 2048), (0, 128, 0))
+    draw = ImageDraw.Draw(img)
+    for x in range(0, 2048, 64):
+        draw.rectangle((x + 30, 0, x + 31, 2047), fill=(255, 255, 255))
+    path = tmp_path / "Trim_ORM.png"
+    img.save(path)
+
+    rec = scan_folder(tmp_path, get_profile("Unreal"))[0]["Trim"].textures[0]
+    info, err = read_image_info(path)
+    assert check_orm_texture(rec, info, err) == []
+
+    # A genuinely flat channel is still reported
+    Image.new("RGB", (2048, 2048), (0, 128, 0)).save(path)
+    messages = [r.message for r in check_orm_texture(rec, *read_image_info(path))]
+    assert any("B channel is flat" in m for m in messages)
+
+
+def test_orm_check_skips_exr_channel_analysis_with_a_warning(monkeypatch: pytest.MonkeyPatch) -> None:
+    from validator.core import orm_validation
+    from validator.core.grouping import TextureRecord
+    from validator.util.image_info import ImageInfo
+
+    def no_reads(path, size):
+        raise AssertionError(f"unexpected decode of {path}")
+
+    monkeypatch.setattr(orm_validation, "_orm_extrema", no_reads)
+    rec = TextureRecord("/x/Crate_ORM.exr", "Crate_ORM.exr", ".exr", None, None)
+    info = ImageInfo(width=8, height=8, mode="RGB", format="EXR", has_alpha=False, channels=3)
+    messages = [r.message for r in orm_validation.check_orm_texture(rec, info, None)]
+    assert messages == ["ORM: Crate_ORM.exr - channel analysis not supported for EXR; check packing manually"]
+
+
+def test_scan_folder_reports_progress(tmp_path: Path) -> None:
+    export_dir = tmp_path / "exports"
+    for asset in ("CrateA", "CrateB", "CrateC"):
+        write_png(export_dir / f"{asset}_BaseColor.png")
+
+    calls = []
+    scan_folder(export_dir, get_profile("Unity"), progress=lambda done, total: calls.append((done, total)))
+
+    assert calls == [(0, 3), (1, 3), (2, 3), (3, 3)]
+
+
+def test_scan_folder_streams_assets_in_walk_order(tmp_path: Path) -> None:
+    export_dir = tmp_path / "exports"
+    for asset in ("crateB", "CrateA", "CrateC"):
+        write_png(export_dir / f"{asset}_BaseColor.png")
+
+    streamed = []
+    groups, _, results_by_asset, _ = scan_folder(
+        export_dir, get_profile("Unity"), on_asset=lambda name, group, res: streamed.append((name, group, res))
+    )
+
+    assert [s[0] for s in streamed] == ["CrateA", "crateB", "CrateC"]
+    for name, group, res in streamed:
+        assert group is groups[name]
+        assert res == results_by_asset[name]
+
+
+def test_scan_folder_single_validate_thread_matches_default(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    import validator.core.batch as batch
+
+    export_dir = tmp_path / "exports"
+    for asset in ("CrateA", "CrateB", "CrateC"):
+        write_png(export_dir / f"{asset}_BaseColor.png")
+    expected = scan_folder(export_dir, get_profile("Unity"))
+
+    sizes = []
+
+    class Recording(batch.ThreadPoolExecutor):
+        def __init__(self, max_workers=None, **kwargs):
+            sizes.append(max_workers)
+            super().__init__(max_workers=max_workers, **kwargs)
+
+    monkeypatch.setattr(batch, "ThreadPoolExecutor", Recording)
+    assert scan_folder(export_dir, get_profile("Unity"), max_workers=1) == expected
+    assert sizes == [1]
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from validator.core.batch import scan_folder
+from validator.core.scan_cache import ScanCache, folder_signature
+from validator.profiles import get_profile
+
+
+def write_png(path: Path, size=(4, 4), mode="RGB") -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    Image.new(mode, size).save(path)
+
+
+def test_scan_cache_reuses_until_tree_changes(tmp_path: Path) -> None:
+    export_dir = tmp_path / "exports"
+    write_png(export_dir / "CrateA_BaseColor.png")
+
+    calls = []
+
+    def counting_scan(folder, profile):
+        calls.append((folder, profile.name))
+        return scan_folder(folder, profile)
+
+    cache = ScanCache()
+    unity = get_profile("Unity")
+
+    first = cache.scan(export_dir, unity, counting_scan)
+    assert cache.scan(export_dir, unity, counting_scan) is first
+    assert len(calls) == 1
+
+    # Different profile -> separate entry
+    cache.scan(export_dir, get_profile("Unreal"), counting_scan)
+    assert len(calls) == 2
+
+    # New file in a subfolder changes the signature
+    write_png(export_dir / "sub" / "CrateA_Normal.png")
+    _, _, _, summary = cache.scan(export_dir, unity, counting_scan)
+    assert len(calls) == 3
+    assert summary.textures_scanned == 2
+
+
+def test_scan_cache_invalidate_and_lru_cap(tmp_path: Path) -> None:
+    folders = []
+    for i in range(3):
+        d = tmp_path / f"f{i}"
+        write_png(d / "CrateA_BaseColor.png")
+        folders.append(d)
+
+    cache = ScanCache(max_entries=2)
+    unity = get_profile("Unity")
+    outs = [cache.scan(d, unity) for d in folders]
+
+    # f0 was evicted; f2 is still cached until invalidated
+    assert cache.scan(folders[0], unity) is not outs[0]
+    assert cache.scan(folders[2], unity) is outs[2]
+    cache.invalidate(folders[2])
+    assert cache.scan(folders[2], unity) is not outs[2]
+
+
+def test_folder_signature_detects_removal(tmp_path: Path) -> None:
+    write_png(tmp_path / "a" / "CrateA_BaseColor.png")
+    write_png(tmp_path / "a" / "CrateA_Normal.png")
+
+    before = folder_signature(tmp_path)
+    (tmp_path / "a" / "CrateA_Normal.png").unlink()
+
+    assert folder_signature(tmp_path) != before
+
+
+def test_folder_signature_detects_replacement_with_older_mtime(tmp_path: Path) -> None:
+    write_png(tmp_path / "CrateA_BaseColor.png", size=(4, 4))
+    write_png(tmp_path / "CrateA_Normal.png")
+    os.utime(tmp_path / "CrateA_BaseColor.png", ns=(10**18, 10**18))
+    before = folder_signature(tmp_path)
+
+    # Same count, newest mtime unchanged: an mtime-preserving copy swaps
+    # the older file for different content
+    normal = tmp_path / "CrateA_Normal.png"
+    old = normal.stat().st_mtime_ns
+    dir_mtime = tmp_path.stat().st_mtime_ns
+    write_png(normal, size=(64, 64))
+    os.utime(normal, ns=(old, old))
+    os.utime(tmp_path, ns=(dir_mtime, dir_mtime))
+
+    assert folder_signature(tmp_path) != before
+
+
+def test_folder_signature_ignores_non_texture_contents(tmp_path: Path) -> None:
+    write_png(tmp_path / "CrateA_BaseColor.png")
+    notes = tmp_path / "notes.txt"
+    notes.write_text("a")
+
+    before = folder_signature(tmp_path)
+    notes.write_text("rewritten")
+    assert folder_signature(tmp_path) == before
+
+
+def test_folder_signature_skips_only_the_root_reports_dir(tmp_path: Path) -> None:
+    write_png(tmp_path / "CrateA_BaseColor.png")
+    write_png(tmp_path / "sub" / "reports" / "CrateA_Normal.png")
+    before = folder_signature(tmp_path)
+
+    write_png(tmp_path / "reports" / "CrateA_Normal.png")
+    assert folder_signature(tmp_path)[1] == before[1]
+
+    (tmp_path / "sub" / "reports" / "CrateA_Normal.png").unlink()
+    assert folder_signature(tmp_path)[1] == before[1] - 1
+
+
+def test_folder_signature_survives_a_report_export(tmp_path: Path) -> None:
+    from validator.core.reporting import ensure_reports_dir
+
+    write_png(tmp_path / "CrateA_BaseColor.png")
+    before = folder_signature(tmp_path)
+
+    (ensure_reports_dir(tmp_path) / "report.json").write_text("{}")
+    assert folder_signature(tmp_path) == before
+
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="needs symlinks")
+def test_folder_signature_follows_file_symlinks(tmp_path: Path) -> None:
+    target = tmp_path / "src" / "CrateA_BaseColor.png"
+    write_png(target)
+    root = tmp_path / "root"
+    root.mkdir()
+    try:
+        (root / "CrateA_BaseColor.png").symlink_to(target)
+    except OSError:
+        pytest.skip("symlinks not permitted")
+    before = folder_signature(root)
+
+    write_png(target, size=(64, 64))
+    assert folder_signature(root) != before
+
+
+def test_image_info_cache_serves_unchanged_files_and_rereads_changed(tmp_path: Path, monkeypatch) -> None:
+    from validator.util import info_cache
+
+    tex = tmp_path / "CrateA_BaseColor.png"
+    write_png(tex, size=(8, 4))
+    cache = info_cache.ImageInfoCache(tmp_path / "cache" / "info.sqlite3")
+    first = cache.read(tex)
+    assert first[1] is None
+
+    def no_reads(path):
+        raise AssertionError(f"unexpected read of {path}")
+
+    with monkeypatch.context() as m:
+        m.setattr(info_cache, "read_image_info", no_reads)
+        assert cache.read(tex) == first
+
+    write_png(tex, size=(16, 4))
+    os.utime(tex, ns=(0, 10**18))
+    assert cache.read(tex)[0].width == 16
+
+    # A folder that can't be reached (share offline) isn't treated as deleted
+    offline = tmp_path / "share" / "CrateB_BaseColor.png"
+    write_png(offline)
+    cache.read(offline)
+    offline.unlink()
+    offline.parent.rmdir()
+
+    tex.unlink()
+    assert cache.prune() == 1
+    assert cache.prune() == 0
+    cache.close()
@@ -1,9 +1,33 @@
 from __future__ import annotations
 
 from validator.profiles import get_profile
+from validator.util.naming import canonicalize_map_token, parse_texture_filename
 
 
 def test_profiles_exist():
     assert get_profile("Unreal").name == "Unreal"
     assert get_profile("Unity").name == "Unity"
     assert get_profile("VFX").name == "VFX"
+
+
+def test_parse_texture_filename_versions_and_aliases():
+    parsed, err = parse_texture_filename("Crate_Big_rough (1)_v012")
+    assert err is None
+    assert (parsed.asset, parsed.map_type, parsed.version, parsed.raw_map_token) == ("Crate_Big", "Roughness", 12, "rough (1)")
+    assert parse_texture_filename("Crate_v012") == (
+        None,
+        "Version suffix present but missing map type (expected Asset_MapType_v###).",
+    )
+    assert parse_texture_filename("Crate_Normal_v12")[1] == "Unknown map type token 'v12'."
+    assert parse_texture_filename("Crate")[1] == "No '_' separator found (expected Asset_MapType[_v###])."
+
+
+def test_canonicalize_map_token_is_memoized():
+    canonicalize_map_token.cache_clear()
+    for token in ("BaseColor", "Roughness-final", " AO ", "ambient occlusion", "nope"):
+        assert canonicalize_map_token(token) == canonicalize_map_token(token)
+    assert canonicalize_map_token("Roughness-final") == "Roughness"
+    assert canonicalize_map_token("ambient occlusion") == "AmbientOcclusion"
+    assert canonicalize_map_token("nope") is None
+    info = canonicalize_map_token.cache_info()
+    assert (info.hits, info.misses) == (8, 5)
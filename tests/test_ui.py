@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtWidgets = pytest.importorskip("PySide6.QtWidgets")
+
+import validator.ui.main_window as mw  # noqa: E402
+
+
+def write_png(path: Path, size=(4, 4), mode="RGB") -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    Image.new(mode, size).save(path)
+
+
+@pytest.fixture
+def window(monkeypatch: pytest.MonkeyPatch):
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    # Pool threads only: no worker processes to spawn in tests
+    monkeypatch.setattr(mw, "USE_MULTIPROCESS", False)
+    w = mw.MainWindow()
+    yield w
+    w.close()
+    app.processEvents()
+
+
+def pump_until(done, timeout: float = 10.0) -> None:
+    app = QtWidgets.QApplication.instance()
+    end = time.monotonic() + timeout
+    while not done():
+        assert time.monotonic() < end, "timed out"
+        app.processEvents()
+        time.sleep(0.01)
+
+
+def test_folder_removed_during_scan_all_stays_out_of_the_summary(window, tmp_path: Path) -> None:
+    folders = [tmp_path / "A", tmp_path / "B"]
+    for folder in folders:
+        write_png(folder / "CrateA_BaseColor.png")
+    window._batch_folders = {mw._folder_key(f): f for f in folders}
+    window._refresh_batch_list()
+
+    window.on_scan_all()
+    assert window._batch_pending is not None
+    window.batch_list.item(1).setSelected(True)
+    window.on_remove_folders()
+    pump_until(lambda: window._batch_pending is None)
+
+    lst = window.batch_summary_list
+    lines = [lst.item(i).text() for i in range(lst.count())]
+    assert lines and not any(str(folders[1]) in line for line in lines)
+    assert list(window._batch_rows) == [folders[0]]
+    assert window._batch_totals["assets_found"] == 1
+    assert [s["folder"] for s in window._last_batch_report["folders"]] == [str(folders[0])]
+
+
+def test_selected_scan_failure_clears_preview_and_disables_export(window, tmp_path: Path, monkeypatch) -> None:
+    write_png(tmp_path / "CrateA_BaseColor.png")
+    window._root = tmp_path
+    window.on_scan_selected()
+    pump_until(lambda: not window._selected_scan_running)
+    assert window.export_json_btn.isEnabled()
+
+    def fail(folder, *args, progress=None, on_item=None):
+        on_item(("CrateA (1)", "CrateA", False))
+        raise OSError("disk gone")
+
+    monkeypatch.setattr(mw, "_scan_selected_job", fail)
+    monkeypatch.setattr(mw.QMessageBox, "critical", lambda *a: None)
+    window.on_scan_selected()
+    pump_until(lambda: not window._selected_scan_running)
+
+    assert window.asset_model.rowCount() == 0
+    assert not window.export_json_btn.isEnabled()
+    assert not window.export_html_btn.isEnabled()
@@ -1,13 +1,25 @@
 import sys
+import threading
+
 from PySide6.QtWidgets import QApplication
 
 from validator.ui.main_window import MainWindow
+from validator.util.info_cache import disable_disk_cache, enable_disk_cache
 
 
 def run_app() -> int:
     app = QApplication(sys.argv)
 
+    # Unchanged images aren't re-read across runs; forget deleted files
+    # in the background so startup doesn't wait on the stats
+    cache = enable_disk_cache()
+    if cache is not None:
+        threading.Thread(target=cache.prune, daemon=True).start()
+
     window = MainWindow()
     window.show()
 
-    return app.exec()
+    try:
+        return app.exec()
+    finally:
+        disable_disk_cache()
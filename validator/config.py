@@ -7,15 +7,26 @@ MAX_SIZE_ERROR = 8192
 # Map-type format expectations (Day 4, lightweight)
 # We treat these as warnings (studios differ).
 ALLOWED_EXT_BY_MAP = {
-    "BaseColor": {".png", ".tif", ".tiff", ".jpg", ".jpeg"},
-    "Normal": {".png", ".tif", ".tiff"},
-    "Roughness": {".png", ".tif", ".tiff", ".jpg", ".jpeg"},
-    "Metallic": {".png", ".tif", ".tiff", ".jpg", ".jpeg"},
-    "AmbientOcclusion": {".png", ".tif", ".tiff", ".jpg", ".jpeg"},
-    "ORM": {".png", ".tif", ".tiff"},
-    "Emissive": {".png", ".tif", ".tiff", ".jpg", ".jpeg"},
-    "Opacity": {".png", ".tif", ".tiff"},
-    "Height": {".png", ".tif", ".tiff", ".exr"},
+    "BaseColor": frozenset({".png", ".tif", ".tiff", ".jpg", ".jpeg"}),
+    "Normal": frozenset({".png", ".tif", ".tiff"}),
+    "Roughness": frozenset({".png", ".tif", ".tiff", ".jpg", ".jpeg"}),
+    "Metallic": frozenset({".png", ".tif", ".tiff", ".jpg", ".jpeg"}),
+    "AmbientOcclusion": frozenset({".png", ".tif", ".tiff", ".jpg", ".jpeg"}),
+    "ORM": frozenset({".png", ".tif", ".tiff"}),
+    "Emissive": frozenset({".png", ".tif", ".tiff", ".jpg", ".jpeg"}),
+    "Opacity": frozenset({".png", ".tif", ".tiff"}),
+    "Height": frozenset({".png", ".tif", ".tiff", ".exr"}),
 }
 
-SUPPORTED_EXTS = {".png", ".tif", ".tiff", ".jpg", ".jpeg", ".exr"}
+SUPPORTED_EXTS = frozenset({".png", ".tif", ".tiff", ".jpg", ".jpeg", ".exr"})
+
+# Folder the exports are written to, directly under the scanned root
+REPORTS_DIR_NAME = "reports"
+
+# Directories never walked for textures, at any depth: VCS/tool caches.
+# Hidden (".") directories are skipped too
+SKIP_DIRS = frozenset({".git", ".hg", ".svn", "__pycache__", "node_modules"})
+
+# Skipped only directly under the scan root: the exports folder. A texture
+# folder that happens to be called "reports" deeper in a pack is walked
+SKIP_ROOT_DIRS = frozenset({REPORTS_DIR_NAME})
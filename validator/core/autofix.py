@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import errno
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 from validator.core.grouping import AssetGroup, TextureRecord
 
@@ -14,49 +17,118 @@ class RenameAction:
     note: str
 
 
-def _unique_path(dst: Path) -> Path:
+def _dir_names(parent: Path) -> Set[str]:
     """
-    If dst exists, add suffix _fixedN before extension.
+    Names present in parent (normcase'd), read with a single scandir.
     """
-    if not dst.exists():
+    try:
+        with os.scandir(parent) as it:
+            return {os.path.normcase(e.name) for e in it}
+    except OSError:
+        return set()
+
+
+def _taken_names(taken: Dict[Path, Set[str]], parent: Path) -> Set[str]:
+    names = taken.get(parent)
+    if names is None:
+        names = _dir_names(parent)
+        taken[parent] = names
+    return names
+
+
+def _desired_name(rec: TextureRecord) -> str:
+    # Target naming: Asset_MapType.ext (keeps the original ext exactly).
+    # rec.ext is lowercased, but its length locates the original suffix
+    # without building a Path
+    return f"{rec.parsed.asset}_{rec.parsed.map_type}{rec.path_str[-len(rec.ext):]}"
+
+
+def prime_taken_names(groups: Iterable[AssetGroup], taken: Dict[Path, Set[str]]) -> None:
+    """
+    Fill taken for every folder that holds a texture needing a rename,
+    listing the folders concurrently. Planning itself stays sequential
+    (targets picked in one folder must see each other); this only overlaps
+    the directory reads plan_renames would otherwise do one at a time.
+    """
+    parents = {
+        rec.path.parent
+        for g in groups
+        for rec in g.textures
+        if rec.parsed and rec.name != _desired_name(rec)
+    }
+    parents = [p for p in parents if p not in taken]
+    if len(parents) < 2:
+        return
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as pool:
+        for parent, names in zip(parents, pool.map(_dir_names, parents)):
+            taken[parent] = names
+
+
+def _unique_path(dst: Path, names: Set[str]) -> Path:
+    """
+    If dst's name is taken, add suffix _fixedN before extension.
+    names is the set of taken (normcase'd) names in dst.parent; the chosen
+    name is added to it so later picks in the same folder don't collide.
+    """
+    key = os.path.normcase(dst.name)
+    if key not in names:
+        names.add(key)
         return dst
 
     stem = dst.stem
     ext = dst.suffix
-    parent = dst.parent
 
     i = 1
     while True:
-        candidate = parent / f"{stem}_fixed{i}{ext}"
-        if not candidate.exists():
-            return candidate
+        name = f"{stem}_fixed{i}{ext}"
+        key = os.path.normcase(name)
+        if key not in names:
+            names.add(key)
+            return dst.with_name(name)
         i += 1
 
 
-def plan_renames(group: AssetGroup) -> List[RenameAction]:
+def _is_case_only_rename(src: Path, dst: Path) -> bool:
+    """
+    True when dst is src under a different case on a case-insensitive FS.
+    """
+    if src.name.lower() != dst.name.lower():
+        return False
+    try:
+        return os.path.samefile(src, dst)
+    except OSError:
+        return False
+
+
+def plan_renames(group: AssetGroup, taken: Optional[Dict[Path, Set[str]]] = None) -> List[RenameAction]:
     """
     Plan renames for all parsed textures in a group.
     Target naming: Asset_MapType.ext (drops version tokens).
+
+    taken: optional parent dir -> taken names cache; share it across groups
+    so each directory is listed once and planned targets don't collide.
     """
     actions: List[RenameAction] = []
+    if taken is None:
+        taken = {}
 
     for rec in group.textures:
         if not rec.parsed:
             continue
 
-        asset = rec.parsed.asset
-        map_type = rec.parsed.map_type
-        ext = rec.path.suffix  # keep original ext exactly
-
-        desired_name = f"{asset}_{map_type}{ext}"
-        desired_path = rec.path.with_name(desired_name)
+        desired_name = _desired_name(rec)
 
         # Skip if already matches desired
-        if rec.path.name == desired_name:
+        if rec.name == desired_name:
             continue
+        desired_path = rec.path.with_name(desired_name)
 
-        # Ensure we don't overwrite; make unique if needed
-        final_dst = _unique_path(desired_path)
+        # Ensure we don't overwrite; make unique if needed. A case-only
+        # rename targets the file itself, so it never needs a suffix.
+        if os.path.normcase(rec.name) == os.path.normcase(desired_name):
+            final_dst = desired_path
+        else:
+            final_dst = _unique_path(desired_path, _taken_names(taken, desired_path.parent))
 
         note = "rename"
         if final_dst != desired_path:
@@ -67,20 +139,75 @@ def plan_renames(group: AssetGroup) -> List[RenameAction]:
     return actions
 
 
+# link() errors meaning "no hard links here" (FAT/exFAT, some SMB mounts)
+_NO_LINK_ERRNOS = frozenset(
+    e for e in (getattr(errno, n, None) for n in ("EPERM", "ENOTSUP", "EOPNOTSUPP", "ENOSYS", "EMLINK")) if e is not None
+)
+
+# Attempts at a fresh _fixedN name when targets keep appearing under us
+_MAX_RENAME_ATTEMPTS = 100
+
+
+def _rename_no_replace(src: Path, dst: Path) -> None:
+    """
+    Rename src to dst, raising FileExistsError instead of replacing dst.
+
+    Windows' rename already refuses to overwrite. On POSIX, rename()
+    silently replaces, so the file is hard-linked to dst (which fails with
+    EEXIST atomically) and then unlinked from src. Filesystems without hard
+    links fall back to a check then rename, which can still race.
+    """
+    if os.name == "nt" or _is_case_only_rename(src, dst):
+        # A case-only rename targets the file itself
+        os.rename(src, dst)
+        return
+    try:
+        os.link(src, dst)
+    except FileExistsError:
+        raise
+    except OSError as e:
+        if e.errno not in _NO_LINK_ERRNOS:
+            raise
+        if os.path.lexists(dst):
+            raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), os.fspath(dst)) from None
+        os.rename(src, dst)
+        return
+    os.unlink(src)
+
+
 def apply_renames(actions: List[RenameAction]) -> Tuple[List[RenameAction], List[str]]:
     """
     Execute renames. Returns (applied_actions, errors).
+    Existing files are never overwritten: a target that exists (or appears
+    meanwhile) gets the next free _fixedN name instead.
     """
     applied: List[RenameAction] = []
     errors: List[str] = []
+    taken: Dict[Path, Set[str]] = {}
 
     for a in actions:
         try:
-            # Re-check collision at time of rename
-            dst = _unique_path(a.dst)
-            a2 = RenameAction(src=a.src, dst=dst, note=a.note)
-            a2.src.rename(a2.dst)
-            applied.append(a2)
+            # Re-check collision at time of rename; only re-probe the folder
+            # when the planned target has appeared since planning
+            dst = a.dst
+            if os.path.lexists(dst) and not _is_case_only_rename(a.src, dst):
+                dst = _unique_path(dst, _taken_names(taken, dst.parent))
+            elif dst.parent in taken:
+                taken[dst.parent].add(os.path.normcase(dst.name))
+
+            for attempt in range(_MAX_RENAME_ATTEMPTS):
+                try:
+                    _rename_no_replace(a.src, dst)
+                    break
+                except FileExistsError:
+                    # Target appeared after the check: take the next free name
+                    if attempt == _MAX_RENAME_ATTEMPTS - 1:
+                        raise
+                    names = _taken_names(taken, dst.parent)
+                    names.add(os.path.normcase(dst.name))
+                    dst = _unique_path(a.dst, names)
+
+            applied.append(RenameAction(src=a.src, dst=dst, note=a.note))
         except Exception as e:
             errors.append(f"Failed to rename '{a.src.name}' -> '{a.dst.name}': {e}")
 
@@ -1,24 +1,176 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import os
+from bisect import insort
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field, replace
+from functools import partial
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple, Union
 
+from validator.core.autofix import RenameAction
 from validator.core.grouping import AssetGroup, TextureRecord, build_groups
-from validator.core.image_metadata import validate_image_metadata
-from validator.core.orm_validation import validate_orm_maps
+from validator.core.image_metadata import allowed_ext_by_map, check_texture_metadata
+from validator.util.fs import is_network_path
+from validator.util.image_info import read_image_info_batch
+from validator.util.info_cache import read_image_info_cached
+from validator.core.orm_validation import check_orm_texture
 from validator.core.required_maps import ValidationResult, count_levels, validate_required_maps
 from validator.profiles import Profile
-from validator.config import SUPPORTED_EXTS
+from validator.config import SKIP_DIRS, SKIP_ROOT_DIRS, SUPPORTED_EXTS
+from validator.util.naming import parse_texture_filename
 
 
-def iter_texture_files(root: Path):
-    for p in root.rglob("*"):
-        if not p.is_file():
+# Threads validating one folder's assets. Capped: past a handful of
+# concurrent readers, disk and GIL contention eat the gain, and Scan All
+# runs several folders at once
+_VALIDATE_WORKERS = min(8, os.cpu_count() or 1)
+
+# Directories listed at once when walking a network share; the threads
+# mostly wait on round trips, so this can exceed the CPU count
+_NETWORK_WALK_WORKERS = 16
+# Image headers read at once on a network share, before validation
+_NETWORK_READ_WORKERS = 32
+
+_SUPPORTED_EXT_LOWER = tuple(sorted(e.lower() for e in SUPPORTED_EXTS))
+_SUPPORTED_EXT_CASED = _SUPPORTED_EXT_LOWER + tuple(e.upper() for e in _SUPPORTED_EXT_LOWER)
+_SUPPORTED_EXT_SET = frozenset(_SUPPORTED_EXT_LOWER)
+# Lowered extension -> one shared str, so each record's ext isn't its own copy
+_EXT_CANONICAL = {e: e for e in _SUPPORTED_EXT_LOWER}
+
+
+def has_texture_ext(name: str) -> bool:
+    """True when a file name has one of the supported texture extensions."""
+    # C-level suffix test covers all-lower/all-upper names without
+    # allocating; on a miss only the extension (not the name) is lowered
+    return name.endswith(_SUPPORTED_EXT_CASED) or name[name.rfind("."):].lower() in _SUPPORTED_EXT_SET
+
+
+def _entry_sort_key(entry: os.DirEntry) -> str:
+    # Directories sort as "name/" so the depth-first walk below yields files
+    # in the same order as sorting full rel paths by rel_path.lower()
+    name = entry.name.lower()
+    return name + "/" if entry.is_dir(follow_symlinks=False) else name
+
+
+def _sorted_entries(path: str, errors: Optional[List[Tuple[str, str]]] = None) -> List[os.DirEntry]:
+    try:
+        with os.scandir(path) as it:
+            entries = list(it)
+    except OSError as e:
+        if errors is not None:
+            errors.append((path, e.strerror or str(e)))
+        return []
+    entries.sort(key=_entry_sort_key)
+    return entries
+
+
+def _skipped_dir(name: str, skip_dirs: FrozenSet[str], skip_hidden: bool) -> bool:
+    return name in skip_dirs or (skip_hidden and name[0] == ".")
+
+
+def _walk_listings(
+    root: str,
+    list_dir: Callable[[str], List[os.DirEntry]],
+    skip_dirs: FrozenSet[str],
+    skip_hidden: bool,
+    skip_root_dirs: FrozenSet[str],
+):
+    # Depth-first over list_dir()'s sorted listings; see iter_texture_files
+    stack = [(iter(list_dir(root)), "")]
+    while stack:
+        entries, rel_dir = stack[-1]
+        entry = next(entries, None)
+        if entry is None:
+            stack.pop()
             continue
-        if p.suffix.lower() not in SUPPORTED_EXTS:
+
+        name = entry.name
+        if entry.is_dir(follow_symlinks=False):
+            if not _skipped_dir(name, skip_dirs, skip_hidden) and (rel_dir or name not in skip_root_dirs):
+                stack.append((iter(list_dir(entry.path)), f"{rel_dir}{name}/"))
+            continue
+
+        # Same test as has_texture_ext, inlined for the hot loop
+        if not name.endswith(_SUPPORTED_EXT_CASED) and name[name.rfind("."):].lower() not in _SUPPORTED_EXT_SET:
             continue
-        yield p
+        stem = name[:name.rfind(".")]
+        if not stem:
+            continue
+        ext = _EXT_CANONICAL[name[len(stem):].lower()]
+        if not entry.is_file():
+            continue
+        yield entry.path, rel_dir + name, stem, ext
+
+
+def iter_texture_files(
+    root: Union[str, Path],
+    skip_dirs: FrozenSet[str] = SKIP_DIRS,
+    errors: Optional[List[Tuple[str, str]]] = None,
+    skip_hidden: bool = True,
+    skip_root_dirs: FrozenSet[str] = SKIP_ROOT_DIRS,
+):
+    """
+    Walk root with os.scandir (DirEntry type info is cached, so no extra stat
+    per entry). Symlinked directories are not followed, same as rglob, and
+    directories named in skip_dirs (or hidden ones, starting with ".") are
+    not entered at all; names in skip_root_dirs are skipped only directly
+    under root.
+
+    A directory that can't be listed (e.g. permission denied) is skipped
+    and the walk goes on; pass errors to collect (dir_path, reason) pairs.
+
+    Yields (path_str, rel_path, stem, ext_lower) tuples built straight from
+    DirEntry.name; rel_path is posix-style and relative to root. Tuples come
+    out ordered by rel_path.lower(), so build_groups doesn't need to sort.
+    Full paths rather than os.fwalk directory fds are handed on: image
+    headers are read after grouping, when the walk is done, and dir_fd
+    isn't supported on Windows.
+    """
+    list_dir = partial(_sorted_entries, errors=errors)
+    return _walk_listings(os.fspath(root), list_dir, skip_dirs, skip_hidden, skip_root_dirs)
+
+
+def iter_texture_files_concurrent(
+    root: Union[str, Path],
+    max_workers: int = _NETWORK_WALK_WORKERS,
+    skip_dirs: FrozenSet[str] = SKIP_DIRS,
+    errors: Optional[List[Tuple[str, str]]] = None,
+    skip_hidden: bool = True,
+    skip_root_dirs: FrozenSet[str] = SKIP_ROOT_DIRS,
+):
+    """
+    iter_texture_files() for high-latency (network) folders: up to
+    max_workers directories are listed at once, so the share's round trips
+    overlap instead of running back to back. Same tuples, same order;
+    errors are collected sorted by directory.
+    """
+    root_str = os.fspath(root)
+    listings: Dict[str, List[os.DirEntry]] = {}
+    walk_errors: List[Tuple[str, str]] = []
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        # list.append is atomic, so the listing threads share walk_errors
+        pending = {pool.submit(_sorted_entries, root_str, walk_errors): root_str}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                path = pending.pop(fut)
+                entries = listings[path] = fut.result()
+                at_root = path == root_str
+                for entry in entries:
+                    if (
+                        entry.is_dir(follow_symlinks=False)
+                        and not _skipped_dir(entry.name, skip_dirs, skip_hidden)
+                        and not (at_root and entry.name in skip_root_dirs)
+                    ):
+                        pending[pool.submit(_sorted_entries, entry.path, walk_errors)] = entry.path
+
+    if errors is not None:
+        errors.extend(sorted(walk_errors))
+    # Replays the listings in walk order; each is dropped once consumed
+    return _walk_listings(root_str, lambda path: listings.pop(path, []), skip_dirs, skip_hidden, skip_root_dirs)
 
 
 @dataclass
@@ -30,35 +182,265 @@ class FolderScanResult:
     errors: int
     warnings: int
     infos: int
+    # (dir_path, reason) for directories the walk couldn't list
+    walk_errors: List[Tuple[str, str]] = field(default_factory=list)
+
+
+def validate_group(
+    group: AssetGroup,
+    profile: Profile,
+    allowed_by_map: Optional[Dict[str, FrozenSet[str]]] = None,
+) -> List[ValidationResult]:
+    """
+    Required-map, metadata and ORM checks in a single pass over the group's
+    textures; each image's metadata is read once and fed to both per-texture
+    checks. Results keep the order of the separate validators.
+
+    Image metadata and ORM results don't depend on the profile; they are
+    kept on the group, so validating it again (e.g. for another profile)
+    doesn't touch the files.
+    """
+    if allowed_by_map is None:
+        allowed_by_map = allowed_ext_by_map(profile)
+
+    infos = group.image_infos
+    orm_done = group.orm_results is not None
+    meta: List[ValidationResult] = []
+    orm: List[ValidationResult] = group.orm_results if orm_done else []
+    for rec in group.textures:
+        if not rec.parsed:
+            continue
+        hit = infos.get(rec.path_str)
+        if hit is None:
+            hit = infos[rec.path_str] = read_image_info_cached(rec.path_str)
+        info, err = hit
+        meta.extend(check_texture_metadata(rec, info, err, allowed_by_map, profile.allow_exr))
+        if not orm_done and rec.parsed.map_type == "ORM":
+            orm.extend(check_orm_texture(rec, info, err))
+    group.orm_results = orm
+
+    # Presence comes from group.map_types_set, so no texture pass here
+    res = validate_required_maps(group, profile)
+    res.extend(meta)
+    res.extend(orm)
+    return res
+
+
+def _prefetch_image_infos(groups: Iterable[AssetGroup]) -> None:
+    todo = [(g, t.path_str) for g in groups for t in g.textures if t.parsed and t.path_str not in g.image_infos]
+    infos = read_image_info_batch(
+        [path for _, path in todo], max_workers=_NETWORK_READ_WORKERS, reader=read_image_info_cached
+    )
+    for (group, path), info in zip(todo, infos):
+        group.image_infos[path] = info
+
+
+def _validate_one(
+    name: str,
+    group: AssetGroup,
+    profile: Profile,
+    allowed_by_map: Dict[str, FrozenSet[str]],
+) -> tuple[str, List[ValidationResult], tuple[int, int, int]]:
+    res = validate_group(group, profile, allowed_by_map)
+    return name, res, count_levels(res)
+
+
+def scan_folder(
+    folder: Path,
+    profile: Profile,
+    progress: Optional[Callable[[int, int], None]] = None,
+    on_asset: Optional[Callable[[str, AssetGroup, List[ValidationResult]], None]] = None,
+    max_workers: Optional[int] = None,
+) -> tuple[Dict[str, AssetGroup], List[TextureRecord], Dict[str, List[ValidationResult]], FolderScanResult]:
+    """
+    Walk, group and validate one folder.
 
+    progress: optional callback(assets_validated, assets_total), called once
+    the files are grouped and then at most ~100 times during validation.
+    on_asset: optional callback(name, group, results), called as each
+    asset's validation completes (in walk order), before the scan returns.
+    max_workers: validation threads (default _VALIDATE_WORKERS); 1 when
+    the caller already runs a scan per CPU, e.g. in a process pool.
+    """
+    # One fspath for both the walk and the summary
+    folder_str = os.fspath(folder)
 
-def scan_folder(folder: Path, profile: Profile) -> tuple[Dict[str, AssetGroup], List[TextureRecord], Dict[str, List[ValidationResult]], FolderScanResult]:
-    files = list(iter_texture_files(folder))
-    groups, unparsed = build_groups(files, folder)
+    # Consume the walk lazily; every file ends up as exactly one record
+    walk_errors: List[Tuple[str, str]] = []
+    network = is_network_path(folder_str)
+    walk = iter_texture_files_concurrent if network else iter_texture_files
+    groups, unparsed = build_groups(walk(folder_str, errors=walk_errors))
+    textures_scanned = len(unparsed) + sum(len(g.textures) for g in groups.values())
+    if network:
+        # Header reads are round-trip bound on a share: overlap many more
+        # of them than the validation pool would, and validate from memory
+        _prefetch_image_infos(groups.values())
 
     results_by_asset: Dict[str, List[ValidationResult]] = {}
     total_e = total_w = total_i = 0
+    allowed_by_map = allowed_ext_by_map(profile)
 
-    for name, group in groups.items():
-        res: List[ValidationResult] = []
-        res.extend(validate_required_maps(group, profile))
-        res.extend(validate_image_metadata(group, profile))
-        res.extend(validate_orm_maps(group))
-        results_by_asset[name] = res
+    total = len(groups)
+    step = max(1, total // 100)
+    if progress:
+        progress(0, total)
+
+    # Validation is mostly Pillow file reads/decodes, which release the GIL
+    workers = _VALIDATE_WORKERS if max_workers is None else max_workers
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, total))) as pool:
+        validated = pool.map(_validate_one, groups.keys(), groups.values(), repeat(profile), repeat(allowed_by_map))
+        for done, (name, res, (e, w, i)) in enumerate(validated, 1):
+            results_by_asset[name] = res
+            total_e += e
+            total_w += w
+            total_i += i
+            if on_asset:
+                on_asset(name, groups[name], res)
+            if progress and (done % step == 0 or done == total):
+                progress(done, total)
+
+    summary = FolderScanResult(
+        folder=folder_str,
+        assets_found=len(groups),
+        textures_scanned=textures_scanned,
+        naming_issues=len(unparsed),
+        errors=total_e,
+        warnings=total_w,
+        infos=total_i,
+        walk_errors=walk_errors,
+    )
+
+    return groups, unparsed, results_by_asset, summary
+
+
+def _walk_order_key(rec: TextureRecord) -> str:
+    return rec.rel_path.lower()
+
+
+def update_scan_after_renames(
+    scan: tuple[Dict[str, AssetGroup], List[TextureRecord], Dict[str, List[ValidationResult]], FolderScanResult],
+    applied: Iterable[RenameAction],
+    profile: Profile,
+) -> tuple[Dict[str, AssetGroup], List[TextureRecord], Dict[str, List[ValidationResult]], FolderScanResult]:
+    """
+    scan_folder() output for the same folder after the applied autofix
+    renames, without walking it again: renamed records are re-parsed under
+    their new names (moving to another group, or to unparsed, when that
+    changes) and only the groups they leave or join are re-validated.
+    Image metadata is carried over, since renaming doesn't change a file.
+
+    The input scan is left untouched.
+    """
+    groups, unparsed, results_by_asset, summary = scan
+    moved = {os.fspath(a.src): a.dst for a in applied}
+    if not moved:
+        return scan
+
+    kept: Dict[str, List[TextureRecord]] = {}
+    arrivals: Dict[str, List[TextureRecord]] = {}
+    new_unparsed: List[TextureRecord] = []
+    infos: Dict[str, tuple] = {}
+    for name, grp in groups.items():
+        if not any(t.path_str in moved for t in grp.textures):
+            continue
+        kept[name] = [t for t in grp.textures if t.path_str not in moved]
+        for rec in grp.textures:
+            dst = moved.get(rec.path_str)
+            if dst is None:
+                continue
+            parsed, err = parse_texture_filename(dst.name.rpartition(".")[0])
+            rel_dir = rec.rel_path.rpartition("/")[0]
+            new_rec = replace(
+                rec,
+                path_str=os.fspath(dst),
+                rel_path=f"{rel_dir}/{dst.name}" if rel_dir else dst.name,
+                parsed=parsed,
+                parse_error=err,
+            )
+            hit = grp.image_infos.get(rec.path_str)
+            if hit is not None:
+                infos[new_rec.path_str] = hit
+            if parsed:
+                arrivals.setdefault(parsed.asset, []).append(new_rec)
+            else:
+                new_unparsed.append(new_rec)
 
+    new_groups = dict(groups)
+    new_results = dict(results_by_asset)
+    for name in kept.keys() | arrivals.keys():
+        old = groups.get(name)
+        # Same order a fresh walk would produce: what stays is already in
+        # walk order, so only the arrivals need placing
+        textures = kept[name] if name in kept else list(old.textures) if old else []
+        for rec in arrivals.get(name, ()):
+            insort(textures, rec, key=_walk_order_key)
+        if not textures:
+            del new_groups[name]
+            del new_results[name]
+            continue
+
+        new_grp = AssetGroup(name=name, textures=textures)
+        old_infos = old.image_infos if old else {}
+        for t in textures:
+            hit = old_infos.get(t.path_str) or infos.get(t.path_str)
+            if hit is not None:
+                new_grp.image_infos[t.path_str] = hit
+        if old is not None and _orm_records(old) == _orm_records(new_grp):
+            # ORM messages name the file, so they only carry over unchanged
+            new_grp.orm_results = old.orm_results
+        new_groups[name] = new_grp
+        new_results[name] = validate_group(new_grp, profile)
+
+    # Groups appear in walk order of their first texture
+    new_groups = dict(sorted(new_groups.items(), key=lambda kv: _walk_order_key(kv[1].textures[0])))
+    new_results = {name: new_results[name] for name in new_groups}
+    if new_unparsed:
+        # unparsed is sorted; insort lowers O(log n) keys per rename
+        # instead of re-sorting (and re-lowering) the whole list
+        unparsed = list(unparsed)
+        for rec in new_unparsed:
+            insort(unparsed, rec, key=_walk_order_key)
+
+    total_e = total_w = total_i = 0
+    for res in new_results.values():
         e, w, i = count_levels(res)
         total_e += e
         total_w += w
         total_i += i
 
-    summary = FolderScanResult(
-        folder=str(folder),
-        assets_found=len(groups),
-        textures_scanned=len(files),
+    return new_groups, unparsed, new_results, replace(
+        summary,
+        assets_found=len(new_groups),
         naming_issues=len(unparsed),
         errors=total_e,
         warnings=total_w,
         infos=total_i,
     )
 
-    return groups, unparsed, results_by_asset, summary
+
+def _orm_records(group: AssetGroup) -> List[TextureRecord]:
+    return [t for t in group.textures if t.parsed and t.parsed.map_type == "ORM"]
+
+
+def revalidate_scan(
+    scan: tuple[Dict[str, AssetGroup], List[TextureRecord], Dict[str, List[ValidationResult]], FolderScanResult],
+    profile: Profile,
+) -> tuple[Dict[str, AssetGroup], List[TextureRecord], Dict[str, List[ValidationResult]], FolderScanResult]:
+    """
+    scan_folder() output for the same files under another profile. Reuses
+    the groups (no walk, no parsing) and the image facts validate_group
+    kept on them, so only the profile-dependent checks run again.
+    """
+    groups, unparsed, _, summary = scan
+    allowed_by_map = allowed_ext_by_map(profile)
+
+    results_by_asset: Dict[str, List[ValidationResult]] = {}
+    total_e = total_w = total_i = 0
+    for name, grp in groups.items():
+        name, res, (e, w, i) = _validate_one(name, grp, profile, allowed_by_map)
+        results_by_asset[name] = res
+        total_e += e
+        total_w += w
+        total_i += i
+
+    return groups, unparsed, results_by_asset, replace(summary, errors=total_e, warnings=total_w, infos=total_i)
@@ -1,33 +1,67 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 from validator.util.naming import ParsedName, parse_texture_filename
 
 
-@dataclass(frozen=True)
+# slots: one record per scanned file, so no per-instance __dict__
+@dataclass(frozen=True, slots=True)
 class TextureRecord:
-    path: Path
+    path_str: str
     rel_path: str
+    # Lowercased once by the walker, dot included; no caller re-lowers it
     ext: str
     parsed: Optional[ParsedName]
     parse_error: Optional[str]
 
+    @property
+    def path(self) -> Path:
+        # Built on use (autofix renames), not for every scanned file
+        return Path(self.path_str)
+
+    @property
+    def name(self) -> str:
+        # rel_path is always "/"-separated, so the file name needs no Path
+        return self.rel_path.rpartition("/")[2]
+
 
 @dataclass
 class AssetGroup:
     name: str
     textures: List[TextureRecord]
+    # Parsed map types present; kept in step with textures by add()
+    map_types_set: Set[str] = field(default_factory=set)
+    # Profile-independent facts filled in by validate_group, so validating
+    # the same group under another profile needs no file reads:
+    # path_str -> read_image_info() result, and the ORM channel checks
+    image_infos: Dict[str, tuple] = field(default_factory=dict, compare=False, repr=False)
+    orm_results: Optional[list] = field(default=None, compare=False, repr=False)
+    _map_types: Optional[List[str]] = field(default=None, init=False, compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.map_types_set.update(t.parsed.map_type for t in self.textures if t.parsed)
+
+    def add(self, rec: TextureRecord) -> None:
+        self.textures.append(rec)
+        if rec.parsed:
+            self.map_types_set.add(rec.parsed.map_type)
+            self._map_types = None
 
     def map_types(self) -> List[str]:
-        types = sorted({t.parsed.map_type for t in self.textures if t.parsed})
-        return types
+        # Sorted once per change; callers must not mutate the returned list
+        if self._map_types is None:
+            self._map_types = sorted(self.map_types_set)
+        return self._map_types
 
 
-def build_groups(files: List[Path], root: Path) -> tuple[Dict[str, AssetGroup], List[TextureRecord]]:
+def build_groups(files: Iterable[Tuple[str, str, str, str]]) -> tuple[Dict[str, AssetGroup], List[TextureRecord]]:
     """
+    files: (path_str, rel_path, stem, ext_lower) tuples from iter_texture_files,
+    already ordered by rel_path.lower(); groups and unparsed keep that order.
+
     Returns:
       groups: asset_name -> AssetGroup
       unparsed: list of TextureRecord that failed parsing
@@ -35,14 +69,13 @@ def build_groups(files: List[Path], root: Path) -> tuple[Dict[str, AssetGroup],
     groups: Dict[str, AssetGroup] = {}
     unparsed: List[TextureRecord] = []
 
-    for p in files:
-        rel = p.relative_to(root).as_posix()
-        parsed, err = parse_texture_filename(p.stem)
+    for path_str, rel, stem, ext in files:
+        parsed, err = parse_texture_filename(stem)
 
         rec = TextureRecord(
-            path=p,
+            path_str=path_str,
             rel_path=rel,
-            ext=p.suffix.lower(),
+            ext=ext,
             parsed=parsed,
             parse_error=err,
         )
@@ -55,11 +88,6 @@ def build_groups(files: List[Path], root: Path) -> tuple[Dict[str, AssetGroup],
         if not grp:
             grp = AssetGroup(name=parsed.asset, textures=[])
             groups[parsed.asset] = grp
-        grp.textures.append(rec)
-
-    # Stable ordering inside groups
-    for g in groups.values():
-        g.textures.sort(key=lambda r: r.rel_path.lower())
+        grp.add(rec)
 
-    unparsed.sort(key=lambda r: r.rel_path.lower())
     return groups, unparsed
@@ -1,15 +1,20 @@
 from __future__ import annotations
 
-from typing import List
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional
 
 from validator.config import ALLOWED_EXT_BY_MAP, MAX_SIZE_ERROR, MAX_SIZE_WARN
 from validator.core.grouping import AssetGroup, TextureRecord
 from validator.core.required_maps import ValidationResult
-from validator.util.image_info import read_image_info
+from validator.util.image_info import ImageInfo, read_image_info
 from validator.profiles import Profile
 
-def _is_power_of_two(n: int) -> bool:
-    return n > 0 and (n & (n - 1)) == 0
+_EMPTY: FrozenSet[str] = frozenset()
+_EXR_ONLY: FrozenSet[str] = frozenset({".exr"})
+
+
+# Powers of two up to 2**30; any real image dimension is covered
+_POT = frozenset(1 << k for k in range(31))
 
 
 def _severity_for_size(w: int, h: int) -> str | None:
@@ -21,7 +26,95 @@ def _severity_for_size(w: int, h: int) -> str | None:
     return None
 
 
-def validate_image_metadata(group: AssetGroup, profile: Profile) -> List[ValidationResult]:
+@lru_cache(maxsize=16)
+def allowed_ext_by_map(profile: Profile) -> Dict[str, FrozenSet[str]]:
+    """
+    Per-profile extension table (EXR added everywhere when the profile allows it).
+    Built once per profile and shared by every scan, so callers must not
+    modify it.
+    """
+    if not profile.allow_exr:
+        return dict(ALLOWED_EXT_BY_MAP)
+    return {k: v | {".exr"} for k, v in ALLOWED_EXT_BY_MAP.items()}
+
+
+@lru_cache(maxsize=None)
+def _expected_exts_text(allowed: FrozenSet[str]) -> str:
+    # A handful of distinct sets, but one warning per mismatched file
+    return str(sorted(allowed))
+
+
+def check_texture_metadata(
+    rec: TextureRecord,
+    info: Optional[ImageInfo],
+    err: Optional[str],
+    allowed_by_map: Dict[str, FrozenSet[str]],
+    allow_exr: bool,
+) -> List[ValidationResult]:
+    """
+    Day 4 checks for one parsed texture, given its read_image_info() result.
+    """
+    results: List[ValidationResult] = []
+
+    map_type = rec.parsed.map_type
+    ext = rec.ext
+
+    # File extension expectations (studio-dependent => warning)
+    allowed = allowed_by_map.get(map_type)
+    if allowed is None:
+        # Unknown map type: only EXR is implied by the profile
+        allowed = _EXR_ONLY if allow_exr else _EMPTY
+
+    if allowed and ext not in allowed:
+        results.append(
+            ValidationResult(
+                "WARNING",
+                f"{map_type}: unexpected file extension '{ext}' (expected one of {_expected_exts_text(allowed)})",
+            )
+        )
+
+    if err:
+        # EXR often isn't supported by default Pillow builds.
+        level = "WARNING" if ext == ".exr" else "ERROR"
+        results.append(ValidationResult(level, f"{map_type}: {rec.rel_path} - {err}"))
+        return results
+
+    w, h = info.width, info.height
+
+    # Size thresholds
+    sev = _severity_for_size(w, h)
+    if sev:
+        results.append(
+            ValidationResult(sev, f"{map_type}: very large resolution ({w}x{h})")
+        )
+
+    # Power-of-two warning (common game rule, not always required)
+    if not (w in _POT and h in _POT):
+        results.append(
+            ValidationResult("WARNING", f"{map_type}: not power-of-two ({w}x{h})")
+        )
+
+    # Channel sanity checks (lightweight)
+    if map_type in {"Normal", "ORM"}:
+        # Expect RGB, warn on alpha
+        if info.channels < 3:
+            results.append(ValidationResult("WARNING", f"{map_type}: suspicious channel count ({info.mode})"))
+        if info.has_alpha:
+            results.append(ValidationResult("WARNING", f"{map_type}: has alpha channel (unexpected)"))
+    elif map_type == "BaseColor":
+        # BaseColor can be RGB/RGBA, but grayscale is suspicious
+        if info.channels == 1:
+            results.append(ValidationResult("WARNING", f"{map_type}: appears grayscale ({info.mode})"))
+
+    return results
+
+
+def validate_image_metadata(
+    group: AssetGroup,
+    profile: Profile,
+    infos: Optional[Dict[str, tuple[Optional[ImageInfo], Optional[str]]]] = None,
+    allowed_by_map: Optional[Dict[str, FrozenSet[str]]] = None,
+) -> List[ValidationResult]:
     """
     Day 4 checks (Pillow):
       - readable image
@@ -29,62 +122,19 @@ def validate_image_metadata(group: AssetGroup, profile: Profile) -> List[Validat
       - max size thresholds (warning/error)
       - channel sanity (basic)
       - extension expectation by map type (warning)
+
+    infos: optional path_str -> read_image_info() result, reused when present.
+    allowed_by_map: optional allowed_ext_by_map(profile) table, built here if omitted.
     """
     results: List[ValidationResult] = []
+    if allowed_by_map is None:
+        allowed_by_map = allowed_ext_by_map(profile)
 
     for rec in group.textures:
         if not rec.parsed:
             continue
-
-        map_type = rec.parsed.map_type
-        ext = rec.ext.lower()
-
-        # File extension expectations (studio-dependent => warning)
-        allowed = set(ALLOWED_EXT_BY_MAP.get(map_type, set()))
-        if profile.allow_exr:
-            allowed.add(".exr")
-
-        if allowed and ext not in allowed:
-            results.append(
-                ValidationResult(
-                    "WARNING",
-                    f"{map_type}: unexpected file extension '{ext}' (expected one of {sorted(allowed)})",
-                )
-            )
-
-
-        info, err = read_image_info(rec.path)
-        if err:
-            # EXR often isn't supported by default Pillow builds.
-            level = "WARNING" if ext == ".exr" else "ERROR"
-            results.append(ValidationResult(level, f"{map_type}: {rec.rel_path} - {err}"))
-            continue
-
-        w, h = info.width, info.height
-
-        # Size thresholds
-        sev = _severity_for_size(w, h)
-        if sev:
-            results.append(
-                ValidationResult(sev, f"{map_type}: very large resolution ({w}x{h})")
-            )
-
-        # Power-of-two warning (common game rule, not always required)
-        if not (_is_power_of_two(w) and _is_power_of_two(h)):
-            results.append(
-                ValidationResult("WARNING", f"{map_type}: not power-of-two ({w}x{h})")
-            )
-
-        # Channel sanity checks (lightweight)
-        if map_type in {"Normal", "ORM"}:
-            # Expect RGB, warn on alpha
-            if info.channels < 3:
-                results.append(ValidationResult("WARNING", f"{map_type}: suspicious channel count ({info.mode})"))
-            if info.has_alpha:
-                results.append(ValidationResult("WARNING", f"{map_type}: has alpha channel (unexpected)"))
-        elif map_type == "BaseColor":
-            # BaseColor can be RGB/RGBA, but grayscale is suspicious
-            if info.channels == 1:
-                results.append(ValidationResult("WARNING", f"{map_type}: appears grayscale ({info.mode})"))
+        cached = infos.get(rec.path_str) if infos else None
+        info, err = cached if cached else read_image_info(rec.path_str)
+        results.extend(check_texture_metadata(rec, info, err, allowed_by_map, profile.allow_exr))
 
     return results
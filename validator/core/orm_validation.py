@@ -1,19 +1,32 @@
 from __future__ import annotations
 
-from typing import List
+from typing import Dict, List, Optional
 
 from PIL import Image
 
-from validator.core.grouping import AssetGroup
+from validator.core.grouping import AssetGroup, TextureRecord
 from validator.core.required_maps import ValidationResult
-from validator.util.image_info import read_image_info
+from validator.util.image_info import ImageInfo, read_image_info
+
+
+# A nearest-neighbour thumbnail is analyzed first. Its extrema lie within the
+# full image's, so a channel that varies there varies in the full image too;
+# but sparse detail (thin metal trim, AO specks) can fall between samples,
+# so a flat or identical-looking thumbnail is re-checked at full resolution
+_ANALYSIS_SIZE = (256, 256)
+
+# Modes whose first three bands are already R, G, B (no convert needed)
+_RGB_FIRST_MODES = frozenset({"RGB", "RGBA", "RGBX"})
 
 
 def _channel_extrema(img: Image.Image) -> tuple[tuple[int, int], tuple[int, int], tuple[int, int]] | None:
     """
-    Returns (R_minmax, G_minmax, B_minmax) for RGB image using getextrema().
+    Returns (R_minmax, G_minmax, B_minmax) using getextrema().
+    RGB/RGBA images are read in place; other modes are converted to RGB first.
     """
     try:
+        if img.mode not in _RGB_FIRST_MODES:
+            img = img.convert("RGB")
         extrema = img.getextrema()
         # For RGB, extrema is: ((rmin,rmax),(gmin,gmax),(bmin,bmax))
         if isinstance(extrema, tuple) and len(extrema) >= 3 and isinstance(extrema[0], tuple):
@@ -23,7 +36,81 @@ def _channel_extrema(img: Image.Image) -> tuple[tuple[int, int], tuple[int, int]
     return None
 
 
-def validate_orm_maps(group: AssetGroup) -> List[ValidationResult]:
+def _orm_extrema(path: str, size: Optional[tuple[int, int]]):
+    """_channel_extrema() of the image at path, of a thumbnail when size is given."""
+    with Image.open(path) as img:
+        if size is not None:
+            # JPEG decodes at reduced scale; everything else is sampled
+            img.draft("RGB", size)
+            img.thumbnail(size, Image.Resampling.NEAREST, reducing_gap=None)
+        return _channel_extrema(img)
+
+
+def _looks_suspicious(ex) -> bool:
+    (rmin, rmax), (gmin, gmax), (bmin, bmax) = ex
+    return rmin == rmax or gmin == gmax or bmin == bmax or ex[0] == ex[1] == ex[2]
+
+
+def check_orm_texture(rec: TextureRecord, info: Optional[ImageInfo], err: Optional[str]) -> List[ValidationResult]:
+    """
+    Day 5 checks for one ORM texture, given its read_image_info() result.
+    """
+    results: List[ValidationResult] = []
+
+    if err:
+        # Let Day 4 handle metadata read errors; keep this as a soft warning
+        results.append(ValidationResult("WARNING", f"ORM: {rec.rel_path} - cannot analyze channels ({err})"))
+        return results
+
+    # Channel count check
+    if info.channels < 3:
+        results.append(ValidationResult("ERROR", f"ORM: {rec.rel_path} - needs RGB (3 channels), got {info.mode}"))
+        return results
+
+    if info.has_alpha:
+        results.append(ValidationResult("WARNING", f"ORM: {rec.rel_path} - has alpha channel (unexpected)"))
+
+    if info.format == "EXR":
+        # Pillow can't decode EXR pixels; say so rather than a vague failure
+        results.append(
+            ValidationResult("WARNING", f"ORM: {rec.rel_path} - channel analysis not supported for EXR; check packing manually")
+        )
+        return results
+
+    # Analyze content quickly
+    try:
+        ex = _orm_extrema(rec.path_str, _ANALYSIS_SIZE)
+        if ex and _looks_suspicious(ex):
+            # Only warn on what the full-resolution pixels confirm
+            ex = _orm_extrema(rec.path_str, None)
+        if not ex:
+            results.append(ValidationResult("WARNING", f"ORM: {rec.rel_path} - could not compute channel extrema"))
+            return results
+
+        (rmin, rmax), (gmin, gmax), (bmin, bmax) = ex
+
+        # Flat channel warnings (common packing mistake)
+        if rmin == rmax:
+            results.append(ValidationResult("WARNING", f"ORM: {rec.rel_path} - R channel is flat (AO may be missing)"))
+        if gmin == gmax:
+            results.append(ValidationResult("WARNING", f"ORM: {rec.rel_path} - G channel is flat (Roughness may be missing)"))
+        if bmin == bmax:
+            results.append(ValidationResult("WARNING", f"ORM: {rec.rel_path} - B channel is flat (Metallic may be missing)"))
+
+        # Grayscale-ish: all channels share same extrema
+        if (rmin, rmax) == (gmin, gmax) == (bmin, bmax):
+            results.append(ValidationResult("WARNING", f"ORM: {rec.rel_path} - channels look identical (may be grayscale, not packed)"))
+
+    except Exception as e:
+        results.append(ValidationResult("WARNING", f"ORM: {rec.rel_path} - channel analysis failed ({e})"))
+
+    return results
+
+
+def validate_orm_maps(
+    group: AssetGroup,
+    infos: Optional[Dict[str, tuple[Optional[ImageInfo], Optional[str]]]] = None,
+) -> List[ValidationResult]:
     """
     Day 5 ORM checks :
       - must be readable
@@ -31,54 +118,16 @@ def validate_orm_maps(group: AssetGroup) -> List[ValidationResult]:
       - warn if alpha present
       - warn if channels look identical (grayscale-ish)
       - warn if any channel is flat (min == max)
+
+    infos: optional path_str -> read_image_info() result, reused when present.
     """
     results: List[ValidationResult] = []
 
-    # Find ORM textures
-    orm_recs = [r for r in group.textures if r.parsed and r.parsed.map_type == "ORM"]
-    if not orm_recs:
-        return results
-
-    for rec in orm_recs:
-        info, err = read_image_info(rec.path)
-        if err:
-            # Let Day 4 handle metadata read errors; keep this as a soft warning
-            results.append(ValidationResult("WARNING", f"ORM: {rec.rel_path} - cannot analyze channels ({err})"))
+    for rec in group.textures:
+        if not rec.parsed or rec.parsed.map_type != "ORM":
             continue
-
-        # Channel count check
-        if info.channels < 3:
-            results.append(ValidationResult("ERROR", f"ORM: {rec.rel_path} - needs RGB (3 channels), got {info.mode}"))
-            continue
-
-        if info.has_alpha:
-            results.append(ValidationResult("WARNING", f"ORM: {rec.rel_path} - has alpha channel (unexpected)"))
-
-        # Analyze content quickly
-        try:
-            with Image.open(rec.path) as img:
-                # Convert to RGB for consistent extrema
-                rgb = img.convert("RGB")
-                ex = _channel_extrema(rgb)
-                if not ex:
-                    results.append(ValidationResult("WARNING", f"ORM: {rec.rel_path} - could not compute channel extrema"))
-                    continue
-
-                (rmin, rmax), (gmin, gmax), (bmin, bmax) = ex
-
-                # Flat channel warnings (common packing mistake)
-                if rmin == rmax:
-                    results.append(ValidationResult("WARNING", f"ORM: {rec.rel_path} - R channel is flat (AO may be missing)"))
-                if gmin == gmax:
-                    results.append(ValidationResult("WARNING", f"ORM: {rec.rel_path} - G channel is flat (Roughness may be missing)"))
-                if bmin == bmax:
-                    results.append(ValidationResult("WARNING", f"ORM: {rec.rel_path} - B channel is flat (Metallic may be missing)"))
-
-                # Grayscale-ish: all channels share same extrema
-                if (rmin, rmax) == (gmin, gmax) == (bmin, bmax):
-                    results.append(ValidationResult("WARNING", f"ORM: {rec.rel_path} - channels look identical (may be grayscale, not packed)"))
-
-        except Exception as e:
-            results.append(ValidationResult("WARNING", f"ORM: {rec.rel_path} - channel analysis failed ({e})"))
+        cached = infos.get(rec.path_str) if infos else None
+        info, err = cached if cached else read_image_info(rec.path_str)
+        results.extend(check_orm_texture(rec, info, err))
 
     return results
@@ -6,22 +6,29 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from validator.config import REPORTS_DIR_NAME
 from validator.core.grouping import AssetGroup, TextureRecord
 from validator.core.required_maps import ValidationResult
 
+try:
+    import orjson  # optional, faster JSON encoder
+except ImportError:
+    orjson = None
+
 
 def iso_now() -> str:
     return datetime.now(timezone.utc).astimezone().isoformat(timespec="seconds")
 
 
 def ensure_reports_dir(root: Path) -> Path:
-    out = root / "reports"
+    out = root / REPORTS_DIR_NAME
     out.mkdir(parents=True, exist_ok=True)
     return out
 
 
 def group_maps_list(group: AssetGroup) -> List[str]:
-    return sorted({r.parsed.map_type for r in group.textures if r.parsed})
+    # Own copy: map_types() hands out the group's cached list
+    return list(group.map_types())
 
 
 def serialize_results(results: List[ValidationResult]) -> List[dict]:
@@ -49,7 +56,7 @@ def build_report_dict(
     autofix_log: Optional[List[str]] = None,
 ) -> dict:
     assets = []
-    for name in sorted(groups.keys(), key=lambda s: s.lower()):
+    for name in sorted(groups.keys(), key=str.casefold):
         g = groups[name]
         assets.append(
             {
@@ -71,22 +78,33 @@ def build_report_dict(
     return report
 
 
+def _write_json(data: dict, output_path: Path) -> None:
+    """
+    Write data as indented UTF-8 JSON. Uses orjson when installed; otherwise
+    json.dump streams chunks to the file instead of building one big string.
+    """
+    if orjson is not None:
+        output_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with output_path.open("w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+
+
 def write_json_report(report: dict, output_path: Path) -> None:
-    output_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    _write_json(report, output_path)
+
+
+_HTML_ESC = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"})
+
+
+def esc(s: str) -> str:
+    return s.translate(_HTML_ESC)
 
 
 def write_html_report(report: dict, output_path: Path) -> None:
     """
     Simple no-deps HTML report (jinja2 comes later if you want).
     """
-    def esc(s: str) -> str:
-        return (
-            s.replace("&", "&amp;")
-            .replace("<", "&lt;")
-            .replace(">", "&gt;")
-            .replace('"', "&quot;")
-        )
-
     title = f"{report.get('tool')} - Report"
     ts = esc(str(report.get("timestamp", "")))
     profile = esc(str(report.get("profile", "")))
@@ -162,7 +180,7 @@ def write_html_report(report: dict, output_path: Path) -> None:
     output_path.write_text(html, encoding="utf-8")
 
 def write_batch_json_report(batch_report: dict, output_path: Path) -> None:
-    output_path.write_text(json.dumps(batch_report, indent=2), encoding="utf-8")
+    _write_json(batch_report, output_path)
 
 
 def build_batch_report_dict(
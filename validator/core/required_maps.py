@@ -6,46 +6,42 @@ from typing import Iterable, List, Set
 from validator.core.grouping import AssetGroup
 from validator.profiles import Profile
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ValidationResult:
     level: str  # "INFO" | "WARNING" | "ERROR"
     message: str
 
+# Always required, in report order
+_REQUIRED_BASE = ("BaseColor", "Normal")
+# Required separately when no ORM is present (Unity/VFX), in report order
+_REQUIRED_SEPARATE = ("AmbientOcclusion", "Roughness", "Metallic")
+
+_ORM_PRESENT = ValidationResult("INFO", "ORM present (AO/Roughness/Metallic packed)")
+_ORM_MISSING = ValidationResult("ERROR", "Missing required packed map: ORM (Unreal profile)")
+_ALL_PRESENT = ValidationResult("INFO", "All required maps present.")
+
+
 def _present_map_types(group: AssetGroup) -> Set[str]:
-    return {rec.parsed.map_type for rec in group.textures if rec.parsed}
+    return group.map_types_set
 
 def validate_required_maps(group: AssetGroup, profile: Profile) -> List[ValidationResult]:
-    results: List[ValidationResult] = []
     present = _present_map_types(group)
 
     # Base requirements (keep strict)
-    if "BaseColor" not in present:
-        results.append(ValidationResult("ERROR", "Missing required map: BaseColor"))
-    if "Normal" not in present:
-        results.append(ValidationResult("ERROR", "Missing required map: Normal"))
+    results = [ValidationResult("ERROR", f"Missing required map: {m}") for m in _REQUIRED_BASE if m not in present]
 
-    # If profile requires ORM (Unreal)
-    if profile.require_orm:
-        if "ORM" in present:
-            results.append(ValidationResult("INFO", "ORM present (AO/Roughness/Metallic packed)"))
-        else:
-            results.append(ValidationResult("ERROR", "Missing required packed map: ORM (Unreal profile)"))
-        return results if results else [ValidationResult("INFO", "All required maps present.")]
-
-    # Unity/VFX: ORM satisfies the AO/Rough/Metal requirement
     if "ORM" in present:
-        results.append(ValidationResult("INFO", "ORM present (AO/Roughness/Metallic packed)"))
-        return results if results else [ValidationResult("INFO", "All required maps present.")]
+        # Packed map satisfies AO/Roughness/Metallic for every profile
+        results.append(_ORM_PRESENT)
+        return results
 
-    # Unity/VFX: no ORM -> require separate AO/Rough/Metallic
-    missing = []
-    if "AmbientOcclusion" not in present:
-        missing.append("AmbientOcclusion")
-    if "Roughness" not in present:
-        missing.append("Roughness")
-    if "Metallic" not in present:
-        missing.append("Metallic")
+    # Unreal needs the packed map itself
+    if profile.require_orm:
+        results.append(_ORM_MISSING)
+        return results
 
+    # Unity/VFX: no ORM -> require separate AO/Rough/Metallic
+    missing = [m for m in _REQUIRED_SEPARATE if m not in present]
     if missing:
         results.append(
             ValidationResult(
@@ -55,7 +51,7 @@ def validate_required_maps(group: AssetGroup, profile: Profile) -> List[Validati
         )
 
     if not results:
-        results.append(ValidationResult("INFO", "All required maps present."))
+        results.append(_ALL_PRESENT)
 
     return results
 
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple, Union
+
+from validator.config import SKIP_DIRS, SKIP_ROOT_DIRS
+from validator.core.batch import FolderScanResult, has_texture_ext, scan_folder
+from validator.core.grouping import AssetGroup, TextureRecord
+from validator.core.required_maps import ValidationResult
+from validator.profiles import Profile
+
+ScanOutput = Tuple[Dict[str, AssetGroup], List[TextureRecord], Dict[str, List[ValidationResult]], FolderScanResult]
+
+
+_MASK64 = (1 << 64) - 1
+
+
+def _entry_digest(path: str, mtime_ns: int, size: int) -> int:
+    # Stable across processes, unlike hash() of a str
+    h = hashlib.blake2b(f"{path}\0{mtime_ns}\0{size}".encode("utf-8", "surrogateescape"), digest_size=8)
+    return int.from_bytes(h.digest(), "little")
+
+
+def folder_signature(
+    folder: Union[str, Path],
+    skip_dirs: FrozenSet[str] = SKIP_DIRS,
+    skip_hidden: bool = True,
+    skip_root_dirs: FrozenSet[str] = SKIP_ROOT_DIRS,
+) -> Tuple[int, int]:
+    """
+    Cheap change detector for a folder tree: (digest, entry count) over
+    the directories and texture files below folder. Each directory
+    contributes its path; each texture file its path, mtime_ns and size,
+    so a file swapped for one with an older mtime (cp -p, robocopy, unzip)
+    still changes the signature. Directory mtimes are left out: they also
+    move when other files come and go (an exported report under folder),
+    and every change they could flag alters some entry anyway. Other files
+    are never stat'ed, and the directories iter_texture_files doesn't walk
+    (skip_dirs, hidden, skip_root_dirs under folder) are left out
+    entirely. Like the walker, file symlinks are followed.
+    """
+    root = os.fspath(folder)
+    # Per-entry digests are summed, so scandir's order doesn't matter
+    digest = count = 0
+    stack = [root]
+    while stack:
+        path = stack.pop()
+        at_root = path == root
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    # d_type answers is_dir without a syscall on most platforms
+                    if entry.is_dir(follow_symlinks=False):
+                        name = entry.name
+                        if name in skip_dirs or (skip_hidden and name[0] == ".") or (at_root and name in skip_root_dirs):
+                            continue
+                        count += 1
+                        digest = (digest + _entry_digest(entry.path, 0, 0)) & _MASK64
+                        stack.append(entry.path)
+                        continue
+                    if not has_texture_ext(entry.name):
+                        continue
+                    try:
+                        if not entry.is_file():
+                            continue
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    count += 1
+                    digest = (digest + _entry_digest(entry.path, st.st_mtime_ns, st.st_size)) & _MASK64
+        except OSError:
+            if path == root:
+                raise
+            continue
+    return digest, count
+
+
+class ScanCache:
+    """
+    Thread-safe LRU of scan_folder() output keyed by
+    (folder, profile name, folder_signature). A changed tree gets a new key,
+    so stale entries simply age out.
+    """
+
+    def __init__(self, max_entries: int = 32) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, ScanOutput] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def scan(
+        self,
+        folder: Path,
+        profile: Profile,
+        scan: Callable[[Path, Profile], ScanOutput] = scan_folder,
+    ) -> ScanOutput:
+        return self.scan_cached(folder, profile, scan)[0]
+
+    def scan_cached(
+        self,
+        folder: Path,
+        profile: Profile,
+        scan: Callable[[Path, Profile], ScanOutput] = scan_folder,
+    ) -> Tuple[ScanOutput, bool]:
+        """Like scan(), also telling whether the result came from the cache."""
+        key = (os.fspath(folder), profile.name, folder_signature(folder))
+        with self._lock:
+            hit = self._entries.get(key)
+            if hit is not None:
+                self._entries.move_to_end(key)
+                return hit, True
+
+        out = scan(folder, profile)
+        self._put(key, out)
+        return out, False
+
+    def store(self, folder: Path, profile: Profile, out: ScanOutput) -> None:
+        """Record out as the scan of folder's current tree (e.g. patched after renames)."""
+        self._put((os.fspath(folder), profile.name, folder_signature(folder)), out)
+
+    def _put(self, key: tuple, out: ScanOutput) -> None:
+        with self._lock:
+            self._entries[key] = out
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, folder: Optional[Path] = None) -> None:
+        """Drop entries for folder (all profiles), or everything when None."""
+        with self._lock:
+            if folder is None:
+                self._entries.clear()
+                return
+            folder_str = os.fspath(folder)
+            for key in [k for k in self._entries if k[0] == folder_str]:
+                del self._entries[key]
@@ -18,9 +18,8 @@ PROFILES = [
     Profile(name="VFX", require_orm=False, allow_separate_rma=True, allow_exr=True),
 ]
 
+_PROFILES_BY_NAME: Dict[str, Profile] = {p.name.lower(): p for p in PROFILES}
+
 
 def get_profile(name: str) -> Profile:
-    for p in PROFILES:
-        if p.name.lower() == name.lower():
-            return p
-    return PROFILES[0]
+    return _PROFILES_BY_NAME.get(name.lower(), PROFILES[0])
@@ -1,10 +1,18 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
+import multiprocessing
+import os
+import time
+from bisect import bisect_right
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
-from PySide6.QtCore import Qt, QFileSystemWatcher, QTimer
+from PySide6.QtCore import Qt, QModelIndex, QThreadPool, QTimer
 from PySide6.QtWidgets import (
     QAbstractItemView,
     QCheckBox,
@@ -13,10 +21,12 @@ from PySide6.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QLineEdit,
+    QListView,
     QListWidget,
     QListWidgetItem,
     QMainWindow,
     QMessageBox,
+    QPlainTextEdit,
     QPushButton,
     QSplitter,
     QStatusBar,
@@ -24,8 +34,8 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from validator.core.autofix import apply_renames, plan_renames
-from validator.core.batch import scan_folder
+from validator.core.autofix import RenameAction, apply_renames, plan_renames, prime_taken_names
+from validator.core.batch import revalidate_scan, scan_folder, update_scan_after_renames
 from validator.core.grouping import AssetGroup, TextureRecord
 from validator.core.reporting import (
     build_batch_report_dict,
@@ -36,10 +46,59 @@ from validator.core.reporting import (
     write_json_report,
 )
 from validator.core.required_maps import ValidationResult, count_levels
+from validator.core.scan_cache import ScanCache
 from validator.profiles import PROFILES, Profile
-
-
+from validator.ui.models import RowListModel
+from validator.ui.watcher import FolderWatcher
+from validator.ui.workers import Task
+from validator.util.info_cache import disk_cache_path, enable_disk_cache
+from validator.util.naming import CANON_MAPS
+
+# Watch-mode rescans: quiet period after the last event, and the longest a
+# continuous stream of events may delay the rescan
+WATCH_DEBOUNCE_MS = 600
+WATCH_MAX_WAIT_S = 5.0
+
+# Batch summary counters, kept as running totals over the folder rows
+_BATCH_TOTAL_KEYS = ("assets_found", "textures_scanned", "naming_issues", "errors", "warnings")
+
+# Parsed map types are always canonical, so their display order (casefolded)
+# is ranked once rather than casefolded again for every asset
+_MAP_TYPE_ORDER = {m: i for i, m in enumerate(sorted(CANON_MAPS, key=str.casefold))}
+
+# Scan All: validate multi-folder batches in worker processes (sidesteps the
+# GIL for parsing/grouping); single-folder batches stay on pool threads
+USE_MULTIPROCESS = True
+
+# Autofix: walk and validate the whole folder again after renames instead of
+# patching the renamed records into the first scan
+AUTOFIX_SAFE_RESCAN = False
+
+
+def _folder_key(p: Path) -> str:
+    # One entry per directory however it was spelled (case on Windows,
+    # symlinks, "..")
+    return os.path.normcase(os.path.realpath(p))
+
+
+@contextmanager
+def _updates_paused(widget: QListWidget) -> Iterator[None]:
+    """
+    Suspend repaints and signals while a list is filled, so Qt lays it out
+    once at the end instead of per inserted row.
+    """
+    widget.setUpdatesEnabled(False)
+    blocked = widget.blockSignals(True)
+    try:
+        yield
+    finally:
+        widget.blockSignals(blocked)
+        widget.setUpdatesEnabled(True)
+
+
+@lru_cache(maxsize=16)
 def profile_summary_text(p: Profile) -> str:
+    # Profile is a frozen dataclass, so it is its own cache key
     lines = [
         f"Profile: {p.name}",
         "",
@@ -58,6 +117,264 @@ def profile_summary_text(p: Profile) -> str:
     return "\n".join(lines)
 
 
+def _apply_autofix(groups: dict[str, AssetGroup]) -> tuple[list[RenameAction], list[str]]:
+    all_actions = []
+    taken: dict[Path, set[str]] = {}
+    # Folder listings are read concurrently up front; planning is sequential
+    prime_taken_names(groups.values(), taken)
+    for g in groups.values():
+        all_actions.extend(plan_renames(g, taken))
+    return apply_renames(all_actions)
+
+
+def _map_rows(group: AssetGroup) -> list:
+    """map_model rows for one asset: a header per map type, then its files."""
+    by_type: defaultdict[str, list[str]] = defaultdict(list)
+    for rec in group.textures:
+        if rec.parsed:
+            by_type[rec.parsed.map_type].append(rec.rel_path)
+
+    rows = []
+    for map_type in sorted(by_type, key=_MAP_TYPE_ORDER.__getitem__):
+        rels = by_type[map_type]
+        rows.append((f"{map_type} ({len(rels)})", None, True))
+        # Child rows are not selectable
+        rows.extend((f"  - {rel}", None, False) for rel in rels)
+    return rows
+
+
+def _asset_row(name: str, group: AssetGroup, results: list[ValidationResult], selectable: bool = True) -> tuple:
+    maps = ", ".join(group.map_types()) or "No parsed maps"
+    e, w, _ = count_levels(results)
+    return f"{name}    [{maps}]    (E:{e} W:{w})", name, selectable
+
+
+_NO_RESULTS_ROW = ("INFO: No results.", None, False)
+
+
+def _selected_view(
+    groups: dict[str, AssetGroup],
+    unparsed: list[TextureRecord],
+    results_by_asset: dict[str, list[ValidationResult]],
+    map_rows: Optional[dict[str, list]] = None,
+    asset_names: Optional[list[str]] = None,
+) -> tuple[list[str], list, list[str], dict[str, list], dict[str, list[str]]]:
+    """
+    Scan Selected display data: (sorted asset names, asset_model rows in
+    the same order, unparsed_model rows, map_model rows per asset,
+    results_model rows per asset).
+    Pass map_rows and asset_names to reuse them when only the validation
+    results changed.
+    """
+    if asset_names is None:
+        asset_names = sorted(groups, key=str.casefold)
+    rows = [_asset_row(name, groups[name], results_by_asset.get(name, [])) for name in asset_names]
+    unparsed_rows = [(f"{rec.rel_path} - {rec.parse_error or 'Unknown parse error'}", None, False) for rec in unparsed]
+    if map_rows is None:
+        map_rows = {name: _map_rows(group) for name, group in groups.items()}
+    result_rows = {
+        name: [(f"{r.level}: {r.message}", None, False) for r in results] or [_NO_RESULTS_ROW]
+        for name, results in results_by_asset.items()
+    }
+    return asset_names, rows, unparsed_rows, map_rows, result_rows
+
+
+def _scan_after_renames(
+    root: Path,
+    profile: Profile,
+    cache: ScanCache,
+    scan_out: tuple,
+    applied: list[RenameAction],
+    scan=scan_folder,
+) -> tuple:
+    # Only the groups renamed textures leave or join are re-validated;
+    # AUTOFIX_SAFE_RESCAN walks and validates the whole folder instead
+    cache.invalidate(root)
+    if AUTOFIX_SAFE_RESCAN:
+        return cache.scan(root, profile, scan)
+    updated = update_scan_after_renames(scan_out, applied, profile)
+    cache.store(root, profile, updated)
+    return updated
+
+
+def _scan_selected_job(
+    root: Path,
+    profile: Profile,
+    autofix: bool,
+    cache: ScanCache,
+    progress=None,
+    on_item=None,
+) -> tuple:
+    """
+    Pool-thread body of Scan Selected: scan, optionally rename + rescan.
+    progress(done, total) is forwarded to scan_folder; on_item gets a
+    preview asset row (not selectable) as each asset is validated.
+    Returns (root, groups, unparsed, results_by_asset, summary, log_lines, view).
+    """
+    on_asset = None
+    if on_item is not None:
+        def on_asset(name, group, results):
+            on_item(_asset_row(name, group, results, selectable=False))
+    scan = partial(scan_folder, progress=progress, on_asset=on_asset)
+    scan_out = cache.scan(root, profile, scan)
+    groups, unparsed, results_by_asset, summary = scan_out
+    log_lines = [f"ERROR: cannot read {path} ({reason})" for path, reason in summary.walk_errors]
+
+    if autofix:
+        # Plan/apply renames for parsed textures, then update the results
+        applied, errors = _apply_autofix(groups)
+
+        if not applied and not errors:
+            log_lines.append("Auto-fix enabled: nothing to rename.")
+        for a in applied:
+            log_lines.append(f"Renamed: {a.src.name} -> {a.dst.name} ({a.note})")
+        for err in errors:
+            log_lines.append(f"ERROR: {err}")
+
+        if applied:
+            scan_out = _scan_after_renames(root, profile, cache, scan_out, applied, scan)
+            groups, unparsed, results_by_asset, summary = scan_out
+    else:
+        log_lines.append("Auto-fix disabled.")
+
+    # Display rows are formatted here, off the GUI thread
+    view = _selected_view(groups, unparsed, results_by_asset)
+    return root, groups, unparsed, results_by_asset, summary, log_lines, view
+
+
+def _export_job(title: str, writer, report, base: Path, filename: str) -> tuple:
+    """
+    Pool-thread body of the export buttons: write report to
+    base/reports/filename. report is a dict, or a zero-argument callable
+    that builds it here. Returns (title, out_path, error, report dict).
+    """
+    try:
+        if callable(report):
+            report = report()
+        out_path = ensure_reports_dir(base) / filename
+        writer(report, out_path)
+    except Exception as e:
+        return title, None, str(e), None
+    return title, out_path, None, report
+
+
+# _scan_batch_job payload tail for a folder that no longer exists
+_FOLDER_GONE = (None, 0, [], None, False)
+
+
+def _batch_rows(folder: Path, payload: Optional[tuple]) -> tuple[dict, list[str]]:
+    """
+    Batch report entry + batch summary lines for one folder.
+    payload is the _scan_batch_job result, or None when the folder is missing.
+    """
+    if payload is None or payload[1:] == _FOLDER_GONE:
+        summary = {
+            "folder": str(folder),
+            "status": "missing",
+            "assets_found": 0,
+            "textures_scanned": 0,
+            "naming_issues": 0,
+            "errors": 0,
+            "warnings": 0,
+            "infos": 0,
+        }
+        return summary, [f"{folder}  - MISSING"]
+
+    _, summary, rename_applied, rename_errors, error, cached = payload
+    if error:
+        failed = {
+            "folder": str(folder),
+            "status": "error",
+            "error": error,
+            "assets_found": 0,
+            "textures_scanned": 0,
+            "naming_issues": 0,
+            "errors": 0,
+            "warnings": 0,
+            "infos": 0,
+        }
+        return failed, [f"{folder}  - SCAN FAILED: {error}"]
+
+    # Batch renames are logged in the summary list (keeps them visible)
+    lines: list[str] = []
+    if rename_applied:
+        lines.append(f"Renamed in {folder}: {rename_applied} file(s)")
+    for err in rename_errors:
+        lines.append(f"ERROR rename in {folder}: {err}")
+    for path, reason in summary.walk_errors:
+        lines.append(f"ERROR cannot read {path} ({reason})")
+    lines.append(
+        f"{folder}  | Assets:{summary.assets_found}  Tex:{summary.textures_scanned}  "
+        f"Issues:{summary.naming_issues}  E:{summary.errors} W:{summary.warnings}  "
+        f"Renamed:{rename_applied} ErrRen:{len(rename_errors)}"
+        + (f"  WalkErr:{len(summary.walk_errors)}" if summary.walk_errors else "")
+        # Tree unchanged since the last scan: results were reused
+        + ("  CACHED" if cached else "")
+    )
+
+    entry = {
+        "folder": summary.folder,
+        "status": "ok",
+        "assets_found": summary.assets_found,
+        "textures_scanned": summary.textures_scanned,
+        "naming_issues": summary.naming_issues,
+        "errors": summary.errors,
+        "warnings": summary.warnings,
+        "infos": summary.infos,
+        "renames_applied": rename_applied,
+        "rename_errors": len(rename_errors),
+        "walk_errors": len(summary.walk_errors),
+    }
+    return entry, lines
+
+
+def _scan_in_process(pool: ProcessPoolExecutor, folder: Path, profile: Profile):
+    # Blocks the calling pool thread, not the GUI; the work runs GIL-free
+    # in a worker process and the scan output is pickled back. The pool has
+    # a process per CPU, so each validates on a single thread
+    return pool.submit(scan_folder, folder, profile, max_workers=1).result()
+
+
+def _scan_batch_job(
+    folder: Path,
+    profile: Profile,
+    rename: bool,
+    cache: ScanCache,
+    pool: Optional[ProcessPoolExecutor] = None,
+) -> tuple:
+    """
+    Pool-thread body for one Scan All folder. With a process pool, cache
+    misses are scanned in a worker process.
+    Returns (folder, summary, renames_applied, rename_errors, error, cached).
+    """
+    # Missing folders are reported, never scanned; this catches a folder
+    # deleted after Scan All queued it
+    if not folder.is_dir():
+        return (folder, *_FOLDER_GONE)
+
+    scan = partial(_scan_in_process, pool) if pool is not None else scan_folder
+    try:
+        rename_applied = 0
+        rename_errors: list[str] = []
+
+        # A cache hit when the tree is unchanged since the last scan (or
+        # rename) with this profile: no walk, parse or validation at all
+        scan_out, cached = cache.scan_cached(folder, profile, scan)
+
+        # --- Optional batch rename (explicit + safe)
+        if rename:
+            applied, rename_errors = _apply_autofix(scan_out[0])
+            rename_applied = len(applied)
+            if applied:
+                scan_out = _scan_after_renames(folder, profile, cache, scan_out, applied, scan)
+                cached = False
+
+        summary = scan_out[3]
+    except Exception as e:
+        return folder, None, 0, [], str(e), False
+    return folder, summary, rename_applied, rename_errors, None, cached
+
+
 class MainWindow(QMainWindow):
     def __init__(self) -> None:
         super().__init__()
@@ -69,26 +386,79 @@ class MainWindow(QMainWindow):
         self._groups: dict[str, AssetGroup] = {}
         self._unparsed: list[TextureRecord] = []
         self._results_by_asset: dict[str, list[ValidationResult]] = {}
+        # Folder and summary the loaded groups/results came from
+        self._scanned_root: Optional[Path] = None
+        self._summary = None
+        # Asset names in asset_model row order
+        self._asset_names: list[str] = []
+        # Casefolded names of the preview rows streamed in during a scan
+        self._preview_keys: list[str] = []
+        # map_model rows per asset, built on the worker with each scan
+        self._map_rows_by_asset: dict[str, list] = {}
+        # results_model rows per asset, formatted alongside the map rows
+        self._result_rows_by_asset: dict[str, list] = {}
 
         # Batch state
-        self._batch_folders: list[Path] = []
+        # _folder_key(folder) -> folder, in the order folders were added
+        self._batch_folders: dict[str, Path] = {}
         self._last_batch_report: Optional[dict] = None
 
         # Reporting / metadata
         self._autofix_log_lines: list[str] = []
         self._tool_version: str = "1.0.0"
+        # Report dict shared by the JSON and HTML exports, once an export
+        # has built it; until then, the builder handed to the pool
+        self._report_cache: Optional[dict] = None
+        self._report_builder: Optional[partial] = None
 
         # Profiles
         self._profile: Profile = PROFILES[0]
 
         # Watcher (optional)
-        self._watcher = QFileSystemWatcher(self)
+        self._watcher = FolderWatcher(self)
         self._watch_enabled = False
         self._debounce_timer = QTimer(self)
         self._debounce_timer.setSingleShot(True)
-        self._debounce_timer.setInterval(600)  # ms
+        self._debounce_timer.setInterval(WATCH_DEBOUNCE_MS)
+        # Latest time a debounced rescan may fire, set by the first event
+        self._debounce_deadline: Optional[float] = None
         self._debounce_timer.timeout.connect(self._on_watch_debounced)
-        self._pending_watch_rescan = False
+        # Batch roots touched since the last debounced rescan
+        self._dirty_folders: set[Path] = set()
+        # normcase(str(root)) -> root for the watched batch folders
+        self._watch_roots: dict[str, Path] = {}
+        # Memo of normcase'd directory -> root it lies in (None: outside)
+        self._watch_dir_roots: dict[str, Optional[Path]] = {}
+        # monotonic time of the latest watch event
+        self._last_watch_event = 0.0
+
+        # Scan results per (folder, profile, tree signature); shared with pool tasks
+        self._scan_cache = ScanCache()
+
+        # Background scans (QThreadPool); tasks are held until they finish.
+        # Multi-folder batches also use a process pool, created on first use.
+        self._scan_processes: Optional[ProcessPoolExecutor] = None
+        self._tasks: set[Task] = set()
+        self._selected_scan_running = False
+        self._rescan_selected_pending = False
+        self._batch_pending: Optional[set[Path]] = None
+        self._batch_results: dict[Path, tuple] = {}
+        self._batch_order: list[Path] = []
+        self._batch_partial = False
+        self._rescan_all_pending = False
+        self._queued_dirty_folders: set[Path] = set()
+        # Renames on one folder run one job at a time: _folder_key of the
+        # folder a Scan Selected may rename, and of the batch folders whose
+        # rename-enabled jobs haven't finished
+        self._selected_rename_key: Optional[str] = None
+        self._batch_rename_keys: set[str] = set()
+        # Export in flight: dialog title -> (its disabled button, report or builder)
+        self._export_buttons: dict[str, tuple[QPushButton, object]] = {}
+
+        # Last batch entry + summary lines per folder, and their list rows
+        self._batch_rows: dict[Path, tuple[dict, list[str]]] = {}
+        self._batch_items: dict[Path, list[QListWidgetItem]] = {}
+        self._batch_totals: dict[str, int] = dict.fromkeys(_BATCH_TOTAL_KEYS, 0)
 
         # --- Top controls (single folder)
         self.folder_label = QLabel("Texture Export Folder:")
@@ -133,7 +503,9 @@ class MainWindow(QMainWindow):
         self.batch_list = QListWidget()
         self.batch_list.setSelectionMode(QAbstractItemView.ExtendedSelection)
 
-        self.asset_list = QListWidget()
+        self.asset_model = RowListModel(self)
+        self.asset_list = QListView()
+        self.asset_list.setModel(self.asset_model)
         self.asset_list.setSelectionMode(QAbstractItemView.SingleSelection)
 
         # --- Right: details
@@ -146,19 +518,29 @@ class MainWindow(QMainWindow):
         self.profile_rules.setAlignment(Qt.AlignTop | Qt.AlignLeft)
         self.profile_rules.setStyleSheet("QLabel { padding: 6px; border: 1px solid #aaa; }")
 
-        self.map_list = QListWidget()
+        self.map_model = RowListModel(self)
+        self.map_list = QListView()
+        self.map_list.setModel(self.map_model)
         self.map_list.setSelectionMode(QAbstractItemView.NoSelection)
 
         self.results_header = QLabel("Validation results:")
-        self.results_list = QListWidget()
+        self.results_model = RowListModel(self)
+        self.results_list = QListView()
+        self.results_list.setModel(self.results_model)
         self.results_list.setSelectionMode(QAbstractItemView.NoSelection)
 
         self.fix_header = QLabel("Auto-fix log:")
-        self.fix_log_list = QListWidget()
-        self.fix_log_list.setSelectionMode(QAbstractItemView.NoSelection)
+        # Append-only text: one document instead of an item per message
+        self.fix_log_list = QPlainTextEdit()
+        self.fix_log_list.setReadOnly(True)
+        self.fix_log_list.setMaximumBlockCount(5000)
 
         self.parse_header = QLabel("Unparsed / naming issues:")
-        self.unparsed_list = QListWidget()
+        # One row per misnamed file, so large packs can fill it: a model
+        # serves rows on demand instead of an item object per line
+        self.unparsed_model = RowListModel(self)
+        self.unparsed_list = QListView()
+        self.unparsed_list.setModel(self.unparsed_model)
         self.unparsed_list.setSelectionMode(QAbstractItemView.NoSelection)
 
         self.batch_summary_header = QLabel("Batch summary:")
@@ -241,7 +623,7 @@ class MainWindow(QMainWindow):
         # --- Signals
         self.pick_btn.clicked.connect(self.on_pick_folder)
         self.scan_btn.clicked.connect(self.on_scan_selected)
-        self.asset_list.currentItemChanged.connect(self.on_asset_selected)
+        self.asset_list.selectionModel().currentChanged.connect(self.on_asset_selected)
 
         self.export_json_btn.clicked.connect(self.on_export_json)
         self.export_html_btn.clicked.connect(self.on_export_html)
@@ -256,8 +638,7 @@ class MainWindow(QMainWindow):
         self.batch_list.currentItemChanged.connect(self.on_batch_selection_changed)
 
         self.watch_checkbox.toggled.connect(self.on_watch_toggled)
-        self._watcher.directoryChanged.connect(self.on_watch_event)
-        self._watcher.fileChanged.connect(self.on_watch_event)
+        self._watcher.changed.connect(self.on_watch_event)
 
     # ----------------------------
     # Profile
@@ -265,11 +646,14 @@ class MainWindow(QMainWindow):
     def on_profile_changed(self, idx: int) -> None:
         idx = max(0, min(idx, len(PROFILES) - 1))
         self._profile = PROFILES[idx]
+        self._invalidate_report()
         self.profile_rules.setText(profile_summary_text(self._profile))
         self.statusBar().showMessage(f"Profile set: {self._profile.name}", 2500)
 
-        # If we have current groups loaded, re-run selected scan validations quickly by re-scanning folder
-        if self._root and self._root.exists():
+        # Files are already grouped for this folder: only re-run the checks
+        if self._groups and self._root == self._scanned_root and not self._selected_scan_running:
+            self._revalidate_only(self._profile)
+        elif self._root and self._root.exists():
             self.on_scan_selected()
 
     # ----------------------------
@@ -285,8 +669,9 @@ class MainWindow(QMainWindow):
         self.scan_btn.setEnabled(True)
 
         # Also add to batch list if not already present
-        if self._root not in self._batch_folders:
-            self._batch_folders.append(self._root)
+        key = _folder_key(self._root)
+        if key not in self._batch_folders:
+            self._batch_folders[key] = self._root
             self._refresh_batch_list(select=self._root)
 
         self.summary_label.setText("Folder selected. Click Scan Selected or Scan All.")
@@ -299,7 +684,8 @@ class MainWindow(QMainWindow):
     def on_batch_selection_changed(self, current: Optional[QListWidgetItem], previous: Optional[QListWidgetItem]) -> None:
         if not current:
             return
-        folder_str = current.data(Qt.UserRole)
+        # Row text is the folder path (see _refresh_batch_list)
+        folder_str = current.text()
         if not folder_str:
             return
         p = Path(folder_str)
@@ -313,18 +699,16 @@ class MainWindow(QMainWindow):
     # Batch folder list
     # ----------------------------
     def _refresh_batch_list(self, select: Optional[Path] = None) -> None:
-        self.batch_list.clear()
-        for p in self._batch_folders:
-            it = QListWidgetItem(str(p))
-            it.setData(Qt.UserRole, str(p))
-            self.batch_list.addItem(it)
+        lst = self.batch_list
+        # Each row's text is its folder path, so no per-item data is set
+        with _updates_paused(lst):
+            lst.clear()
+            lst.addItems([str(p) for p in self._batch_folders.values()])
 
         if select:
-            for i in range(self.batch_list.count()):
-                it = self.batch_list.item(i)
-                if Path(it.data(Qt.UserRole)) == select:
-                    self.batch_list.setCurrentRow(i)
-                    break
+            key = _folder_key(select)
+            if key in self._batch_folders:
+                lst.setCurrentRow(list(self._batch_folders).index(key))
 
     def on_add_folder(self) -> None:
         start_dir = str(Path.home())
@@ -332,8 +716,7 @@ class MainWindow(QMainWindow):
         if not folder:
             return
         p = Path(folder)
-        if p not in self._batch_folders:
-            self._batch_folders.append(p)
+        self._batch_folders.setdefault(_folder_key(p), p)
         self._refresh_batch_list(select=p)
 
         if self._watch_enabled:
@@ -343,10 +726,17 @@ class MainWindow(QMainWindow):
         selected = self.batch_list.selectedItems()
         if not selected:
             return
-        remove_set = {Path(it.data(Qt.UserRole)) for it in selected}
-        self._batch_folders = [p for p in self._batch_folders if p not in remove_set]
+        remove_set = {Path(it.text()) for it in selected}
+        for p in remove_set:
+            self._batch_folders.pop(_folder_key(p), None)
         self._refresh_batch_list()
 
+        # Drop the removed folders' summary rows and their share of the totals
+        for p in remove_set:
+            self._set_batch_row(p, None)
+        # A batch in flight must not bring them back when it finishes
+        self._batch_order = [f for f in self._batch_order if f not in remove_set]
+
         if self._watch_enabled:
             self._reset_watches()
 
@@ -359,211 +749,320 @@ class MainWindow(QMainWindow):
             self._reset_watches()
             self.statusBar().showMessage("Watching folders for changes.", 2500)
         else:
-            self._watcher.removePaths(self._watcher.directories())
-            self._watcher.removePaths(self._watcher.files())
+            self._watcher.clear()
             self.statusBar().showMessage("Watch disabled.", 2500)
 
     def _reset_watches(self) -> None:
-        # Clear existing
-        if self._watcher.directories():
-            self._watcher.removePaths(self._watcher.directories())
-        if self._watcher.files():
-            self._watcher.removePaths(self._watcher.files())
-
-        # Add directory watches (top-level folders only; good enough for v1)
-        dirs = [str(p) for p in self._batch_folders if p.exists()]
-        if dirs:
-            self._watcher.addPaths(dirs)
-
-    def on_watch_event(self, _path: str) -> None:
+        # Recursive with watchdog; top-level folders only without it
+        self._watch_roots = {os.path.normcase(str(p)): p for p in self._batch_folders.values()}
+        self._watch_dir_roots = {}
+        self._watcher.set_paths(self._batch_folders.values())
+
+    def _watch_root_for(self, path: str) -> Optional[Path]:
+        cur = os.path.normcase(os.path.normpath(path))
+        root = self._watch_roots.get(cur)
+        if root is not None:
+            return root
+
+        # Event bursts hit the same few directories: route by parent dir
+        parent = os.path.dirname(cur)
+        try:
+            return self._watch_dir_roots[parent]
+        except KeyError:
+            pass
+        if len(self._watch_dir_roots) >= 4096:
+            self._watch_dir_roots.clear()
+        root = self._watch_dir_roots[parent] = self._walk_up_to_root(parent)
+        return root
+
+    def _walk_up_to_root(self, cur: str) -> Optional[Path]:
+        # Walk up until a watched root matches: O(depth), not O(roots); the
+        # deepest root wins when batch folders are nested
+        while True:
+            root = self._watch_roots.get(cur)
+            if root is not None:
+                return root
+            parent = os.path.dirname(cur)
+            if parent == cur:
+                return None
+            cur = parent
+
+    def on_watch_event(self, path: str) -> None:
         if not self._watch_enabled:
             return
-        # Debounce so we don't rescan 20 times during a copy/export
-        self._pending_watch_rescan = True
-        self._debounce_timer.start()
+        root = self._watch_root_for(path)
+        if root is None:
+            return
+        now = time.monotonic()
+        self._last_watch_event = now
+        if root in self._dirty_folders:
+            # Already queued: the timer is armed and re-checks the quiet
+            # period itself, so a burst of events costs O(1) each
+            return
+        # Debounce so we don't rescan 20 times during a copy/export, but cap
+        # the total wait so a long copy can't postpone the rescan forever
+        self._dirty_folders.add(root)
+        if self._debounce_deadline is None:
+            self._debounce_deadline = now + WATCH_MAX_WAIT_S
+            self._debounce_timer.start(WATCH_DEBOUNCE_MS)
 
     def _on_watch_debounced(self) -> None:
-        if not self._pending_watch_rescan:
+        now = time.monotonic()
+        if self._debounce_deadline is not None and now < self._debounce_deadline:
+            # Events still arriving: wait for a full quiet period, up to the deadline
+            quiet_ms = int((self._last_watch_event - now) * 1000) + WATCH_DEBOUNCE_MS
+            if quiet_ms > 0:
+                deadline_ms = int((self._debounce_deadline - now) * 1000)
+                self._debounce_timer.start(max(1, min(quiet_ms, deadline_ms)))
+                return
+        self._debounce_deadline = None
+        if not self._dirty_folders:
             return
-        self._pending_watch_rescan = False
-        # Auto scan-all
-        self.on_scan_all()
+        dirty = [f for f in self._batch_folders.values() if f in self._dirty_folders]
+        self._dirty_folders.clear()
+        if not dirty:
+            return
+        if self._batch_rows:
+            # Rescan only the folders that changed; other rows stay as they are
+            self._scan_batch(dirty, partial=True)
+        else:
+            # No batch results yet: behave like Scan All
+            self.on_scan_all()
 
     # ----------------------------
     # Scans
     # ----------------------------
     def _clear_right_panels(self) -> None:
-        self.asset_list.clear()
-        self.map_list.clear()
-        self.results_list.clear()
-        self.unparsed_list.clear()
-        self.fix_log_list.clear()
+        self.asset_model.clear()
+        self.map_model.clear()
+        self.results_model.clear()
+        self.unparsed_model.clear()
 
     def on_scan_selected(self) -> None:
         if not self._root or not self._root.exists():
             self.statusBar().showMessage("Invalid folder.", 4000)
             return
 
+        if self._selected_scan_running:
+            # Never run two scans (and possibly renames) on one folder at once
+            self._rescan_selected_pending = True
+            return
+
+        autofix = self.autofix_checkbox.isChecked()
+        root_key = _folder_key(self._root)
+        if autofix and root_key in self._batch_rename_keys:
+            # A batch job may be renaming this folder; run once it is done
+            self._rescan_selected_pending = True
+            self.statusBar().showMessage("Waiting for Scan All to finish renaming this folder...")
+            return
+
         self._clear_right_panels()
-        self.batch_summary_list.clear()
+        self._preview_keys = []
+        self._clear_batch_rows()
         self._autofix_log_lines.clear()
+        self.fix_log_list.clear()
+        self._invalidate_report()
         self._last_batch_report = None
         self.export_batch_btn.setEnabled(False)
 
-        # Scan folder (build groups, results)
+        # Scan folder (build groups, results) on the thread pool.
         # Optional auto-fix naming is applied only for selected scan (keeps batch safe)
         # If you want it in batch too later, we can add that.
-        groups, unparsed, results_by_asset, summary = scan_folder(self._root, self._profile)
-
-        if self.autofix_checkbox.isChecked():
-            # Plan/apply renames for parsed textures, then rescan
-            all_actions = []
-            for g in groups.values():
-                all_actions.extend(plan_renames(g))
-            applied, errors = apply_renames(all_actions)
-
-            if not applied and not errors:
-                line = "Auto-fix enabled: nothing to rename."
-                self.fix_log_list.addItem(QListWidgetItem(line))
-                self._autofix_log_lines.append(line)
-
-            for a in applied:
-                line = f"Renamed: {a.src.name} -> {a.dst.name} ({a.note})"
-                self.fix_log_list.addItem(QListWidgetItem(line))
-                self._autofix_log_lines.append(line)
-
-            for err in errors:
-                line = f"ERROR: {err}"
-                self.fix_log_list.addItem(QListWidgetItem(line))
-                self._autofix_log_lines.append(line)
-
-            # Rescan after rename
-            groups, unparsed, results_by_asset, summary = scan_folder(self._root, self._profile)
-
-        else:
-            line = "Auto-fix disabled."
-            self.fix_log_list.addItem(QListWidgetItem(line))
-            self._autofix_log_lines.append(line)
+        self._selected_scan_running = True
+        self._selected_rename_key = root_key if autofix else None
+        self.scan_btn.setEnabled(False)
+        self.statusBar().showMessage("Scanning...")
+        self._start_task(
+            self._on_scan_selected_done,
+            _scan_selected_job,
+            self._root,
+            self._profile,
+            autofix,
+            self._scan_cache,
+            on_progress=self._on_scan_selected_progress,
+            on_item=self._on_scan_selected_asset,
+            on_failed=self._on_scan_selected_failed,
+        )
 
+    def _on_scan_selected_asset(self, row: tuple) -> None:
+        # Preview rows land in sorted position while the scan runs; the
+        # final (selectable) rows replace them when it completes
+        if not self._selected_scan_running:
+            return
+        key = row[1].casefold()
+        pos = bisect_right(self._preview_keys, key)
+        self._preview_keys.insert(pos, key)
+        self.asset_model.insert_row(pos, row)
+
+    def _on_scan_selected_progress(self, done: int, total: int) -> None:
+        if self._selected_scan_running:
+            self.statusBar().showMessage(f"Scanning... validated {done}/{total} assets")
+
+    def _revalidate_only(self, profile: Profile) -> None:
+        """
+        Apply a profile change to the loaded Scan Selected results without
+        walking or reading the folder again.
+        """
+        scan_out = revalidate_scan((self._groups, self._unparsed, self._results_by_asset, self._summary), profile)
+        self._clear_right_panels()
+        self._clear_batch_rows()
+        self._last_batch_report = None
+        self.export_batch_btn.setEnabled(False)
+        groups, unparsed, results_by_asset, _ = scan_out
+        # Same groups, so the name order and per-asset map rows still hold
+        view = _selected_view(groups, unparsed, results_by_asset, self._map_rows_by_asset, self._asset_names)
+        self._show_selected_scan((self._scanned_root, *scan_out, [], view))
+        self.statusBar().showMessage(f"Re-validated for profile {profile.name}.", 2500)
+
+    def _on_scan_selected_done(self, payload: tuple) -> None:
+        self._finish_selected_scan()
+        self._show_selected_scan(payload)
+
+    def _show_selected_scan(self, payload: tuple) -> None:
+        root, groups, unparsed, results_by_asset, summary, log_lines, view = payload
+        # The log only grows between Scan Selected starts (which clear it),
+        # so just the new lines are laid out; re-validation adds none
+        if log_lines:
+            self._autofix_log_lines.extend(log_lines)
+            self.fix_log_list.appendPlainText("\n".join(log_lines))
+
+        self._scanned_root = root
+        self._summary = summary
         self._groups = groups
+        self._invalidate_report()
         self._unparsed = unparsed
         self._results_by_asset = results_by_asset
 
-        # Populate asset list with counts
-        asset_names = sorted(self._groups.keys(), key=lambda s: s.lower())
-        for name in asset_names:
-            g = self._groups[name]
-            maps = ", ".join(g.map_types()) if g.map_types() else "No parsed maps"
-            res = self._results_by_asset.get(name, [])
-            e, w, _ = count_levels(res)
-            item = QListWidgetItem(f"{name}    [{maps}]    (E:{e} W:{w})")
-            item.setData(Qt.UserRole, name)
-            self.asset_list.addItem(item)
-
-        # Naming issues
-        for rec in self._unparsed:
-            msg = rec.parse_error or "Unknown parse error"
-            self.unparsed_list.addItem(QListWidgetItem(f"{rec.rel_path} - {msg}"))
+        # Asset list with counts, and naming issues; rows come preformatted
+        self._asset_names, asset_rows, unparsed_rows, self._map_rows_by_asset, self._result_rows_by_asset = view
+        self.asset_model.set_rows(asset_rows)
+        self.unparsed_model.set_rows(unparsed_rows)
 
         self.summary_label.setText(
             f"Profile: {self._profile.name} | "
-            f"Folder: {self._root} | "
+            f"Folder: {root} | "
             f"Assets: {summary.assets_found} | "
             f"Textures: {summary.textures_scanned} | "
             f"Naming issues: {summary.naming_issues} | "
             f"Errors: {summary.errors} | Warnings: {summary.warnings}"
+            + (f" | Walk errors: {len(summary.walk_errors)}" if summary.walk_errors else "")
         )
 
         self.export_json_btn.setEnabled(True)
         self.export_html_btn.setEnabled(True)
 
-        if self.asset_list.count() > 0:
-            self.asset_list.setCurrentRow(0)
+        if self.asset_model.rowCount() > 0:
+            self.asset_list.setCurrentIndex(self.asset_model.index(0))
         else:
             self.asset_header.setText("No assets found.")
 
         self.statusBar().showMessage("Scan Selected complete.", 2500)
 
+    def _on_scan_selected_failed(self, err: str) -> None:
+        self._finish_selected_scan()
+        # Only preview rows are listed: drop them, and keep the last scan's
+        # results from being exported as this folder's
+        self.asset_model.clear()
+        self._preview_keys = []
+        self._invalidate_report()
+        self.export_json_btn.setEnabled(False)
+        self.export_html_btn.setEnabled(False)
+        QMessageBox.critical(self, "Scan Selected", f"Failed:\n{err}")
+
+    def _finish_selected_scan(self) -> None:
+        self._selected_scan_running = False
+        self._selected_rename_key = None
+        self.scan_btn.setEnabled(True)
+        if self._rescan_selected_pending:
+            # Settings changed mid-scan; results are about to be replaced
+            self._rescan_selected_pending = False
+            QTimer.singleShot(0, self.on_scan_selected)
+        if self._batch_pending is None:
+            # Batch scans held back for this scan's renames
+            self._start_queued_batch()
+
     def on_scan_all(self) -> None:
         if not self._batch_folders:
             self.statusBar().showMessage("No batch folders to scan.", 3000)
             return
+        self._scan_batch(list(self._batch_folders.values()))
+
+    def _scan_batch(self, folders: list[Path], partial: bool = False) -> None:
+        """
+        Scan folders on the pool. partial=True (watch rescans) keeps the other
+        folders' last results and only replaces these folders' rows.
+        """
+        rename = self.autofix_checkbox.isChecked() and self.batch_rename_checkbox.isChecked()
+        # Wait for a running batch, or for a Scan Selected that may be
+        # renaming one of these folders
+        renaming_selected = rename and self._selected_rename_key in {_folder_key(f) for f in folders}
+        if self._batch_pending is not None or renaming_selected:
+            if partial:
+                self._queued_dirty_folders.update(folders)
+            else:
+                self._rescan_all_pending = True
+            return
 
-        self.batch_summary_list.clear()
-        summaries: list[dict] = []
-
-        total_assets = total_textures = total_issues = total_e = total_w = 0
-
-        for folder in self._batch_folders:
-            if not folder.exists():
-                summaries.append(
-                    {
-                        "folder": str(folder),
-                        "status": "missing",
-                        "assets_found": 0,
-                        "textures_scanned": 0,
-                        "naming_issues": 0,
-                        "errors": 0,
-                        "warnings": 0,
-                        "infos": 0,
-                    }
-                )
-                self.batch_summary_list.addItem(QListWidgetItem(f"{folder}  - MISSING"))
-                continue
-
-                # --- Optional batch rename (explicit + safe)
-            rename_applied = 0
-            rename_errors = 0
-
-            if self.autofix_checkbox.isChecked() and self.batch_rename_checkbox.isChecked():
-                # First pass groups for planning renames
-                groups0, unparsed0, results0, summary0 = scan_folder(folder, self._profile)
-
-                all_actions = []
-                for g in groups0.values():
-                    all_actions.extend(plan_renames(g))
-
-                applied, errors = apply_renames(all_actions)
-                rename_applied = len(applied)
-                rename_errors = len(errors)
-
-                # Optional: log in batch summary list (keeps it visible)
-                if rename_applied:
-                    self.batch_summary_list.addItem(QListWidgetItem(f"Renamed in {folder}: {rename_applied} file(s)"))
-                for err in errors:
-                    self.batch_summary_list.addItem(QListWidgetItem(f"ERROR rename in {folder}: {err}"))
-
-            # Final scan (always) after optional renames
-            groups, unparsed, results_by_asset, summary = scan_folder(folder, self._profile)
-
-            summaries.append(
-                {
-                    "folder": summary.folder,
-                    "status": "ok",
-                    "assets_found": summary.assets_found,
-                    "textures_scanned": summary.textures_scanned,
-                    "naming_issues": summary.naming_issues,
-                    "errors": summary.errors,
-                    "warnings": summary.warnings,
-                    "infos": summary.infos,
-                    "renames_applied": rename_applied,
-                    "rename_errors": rename_errors,
-                }
-            )
-
-            total_assets += summary.assets_found
-            total_textures += summary.textures_scanned
-            total_issues += summary.naming_issues
-            total_e += summary.errors
-            total_w += summary.warnings
-
-            self.batch_summary_list.addItem(
-                QListWidgetItem(
-                    f"{folder}  | Assets:{summary.assets_found}  Tex:{summary.textures_scanned}  "
-                    f"Issues:{summary.naming_issues}  E:{summary.errors} W:{summary.warnings}  "
-                    f"Renamed:{rename_applied} ErrRen:{rename_errors}"
-                )
-            )
+        if not partial:
+            self._clear_batch_rows()
+
+        # One pool task per existing folder; missing ones are reported inline
+        self._batch_order = folders
+        self._batch_partial = partial
+        self._batch_results = {}
+        self._batch_pending = {f for f in folders if f.exists()}
+        self._batch_rename_keys = {_folder_key(f) for f in self._batch_pending} if rename else set()
+        self.scan_all_btn.setEnabled(False)
+        self.statusBar().showMessage("Scanning batch...")
+
+        # Independent folders: spread multi-folder batches over processes
+        pool = self._process_pool() if USE_MULTIPROCESS and len(self._batch_pending) > 1 else None
+        for folder in self._batch_pending:
+            self._start_task(self._on_batch_folder_done, _scan_batch_job, folder, self._profile, rename, self._scan_cache, pool)
+
+        if not self._batch_pending:
+            self._finish_scan_all()
+
+    def _on_batch_folder_done(self, payload: tuple) -> None:
+        folder = payload[0]
+        self._batch_results[folder] = payload
+        self._batch_pending.discard(folder)
+        if self._batch_rename_keys:
+            self._batch_rename_keys.discard(_folder_key(folder))
+            if self._rescan_selected_pending and not self._selected_scan_running:
+                # A Scan Selected waiting on this folder's renames; it
+                # checks again and keeps waiting if its folder isn't done
+                self._rescan_selected_pending = False
+                QTimer.singleShot(0, self.on_scan_selected)
+        if not self._batch_pending:
+            self._finish_scan_all()
+            return
+        done = len(self._batch_results)
+        self.statusBar().showMessage(f"Scanning batch... {done}/{done + len(self._batch_pending)} folders")
+
+    def _finish_scan_all(self) -> None:
+        self._batch_pending = None
+        self._batch_rename_keys.clear()
+        self.scan_all_btn.setEnabled(True)
+
+        # A full scan starts from an empty list, so every folder's rows go
+        # in with one addItems call; a partial rescan updates its folders'
+        # rows in place. Folders removed meanwhile are left out
+        listed = set(self._batch_folders.values())
+        rows = [
+            (folder, _batch_rows(folder, self._batch_results.get(folder)))
+            for folder in self._batch_order
+            if folder in listed
+        ]
+        with _updates_paused(self.batch_summary_list):
+            if not self._batch_items:
+                self._append_batch_rows(rows)
+            else:
+                for folder, row in rows:
+                    self._set_batch_row(folder, row)
+
+        summaries = [self._batch_rows[f][0] for f in self._batch_folders.values() if f in self._batch_rows]
+        totals = self._batch_totals
 
         batch_report = build_batch_report_dict(
             tool_version=self._tool_version,
@@ -575,98 +1074,226 @@ class MainWindow(QMainWindow):
 
         self.summary_label.setText(
             f"Batch ({self._profile.name}) | "
-            f"Folders: {len(self._batch_folders)} | Assets: {total_assets} | Textures: {total_textures} | "
-            f"Naming issues: {total_issues} | Errors: {total_e} | Warnings: {total_w}"
+            f"Folders: {len(self._batch_folders)} | Assets: {totals['assets_found']} | "
+            f"Textures: {totals['textures_scanned']} | Naming issues: {totals['naming_issues']} | "
+            f"Errors: {totals['errors']} | Warnings: {totals['warnings']}"
         )
         self.statusBar().showMessage("Scan All complete.", 2500)
+        self._start_queued_batch()
+
+    def _start_queued_batch(self) -> None:
+        """Run the batch scan requested while another scan held it back."""
+        if self._rescan_all_pending:
+            self._rescan_all_pending = False
+            self._queued_dirty_folders.clear()
+            QTimer.singleShot(0, self.on_scan_all)
+        elif self._queued_dirty_folders:
+            dirty = [f for f in self._batch_folders.values() if f in self._queued_dirty_folders]
+            self._queued_dirty_folders.clear()
+            QTimer.singleShot(0, lambda: self._scan_batch(dirty, partial=True))
+
+    def _clear_batch_rows(self) -> None:
+        self.batch_summary_list.clear()
+        self._batch_items.clear()
+        self._batch_rows.clear()
+        self._batch_totals = dict.fromkeys(_BATCH_TOTAL_KEYS, 0)
+
+    def _append_batch_rows(self, rows: list[tuple[Path, tuple[dict, list[str]]]]) -> None:
+        """_set_batch_row for folders that have no rows yet, in one addItems call."""
+        lst = self.batch_summary_list
+        lines: list[str] = []
+        for folder, row in rows:
+            self._batch_rows[folder] = row
+            for key in _BATCH_TOTAL_KEYS:
+                self._batch_totals[key] += row[0][key]
+            lines.extend(row[1])
+
+        at = lst.count()
+        lst.addItems(lines)
+        # Bound once: one call per summary line of every folder
+        item = lst.item
+        for folder, (_, folder_lines) in rows:
+            if folder_lines:
+                self._batch_items[folder] = [item(i) for i in range(at, at + len(folder_lines))]
+                at += len(folder_lines)
+
+    def _set_batch_row(self, folder: Path, row: Optional[tuple[dict, list[str]]]) -> None:
+        """
+        Replace folder's batch entry (None removes it): adjusts the running
+        totals by the difference and updates its summary rows in place.
+        Folders without rows yet are appended.
+        """
+        old_row = self._batch_rows.pop(folder, None)
+        for key in _BATCH_TOTAL_KEYS:
+            self._batch_totals[key] += (row[0][key] if row else 0) - (old_row[0][key] if old_row else 0)
+
+        lst = self.batch_summary_list
+        old = self._batch_items.pop(folder, [])
+        lines = row[1] if row else []
+        if row is not None:
+            self._batch_rows[folder] = row
+
+        if len(old) == len(lines):
+            # Same shape (the usual rescan): just retext the existing rows
+            for it, line in zip(old, lines):
+                it.setText(line)
+            if old:
+                self._batch_items[folder] = old
+            return
+
+        # A folder's rows are contiguous, so each take pulls the next one
+        # up to at; no per-item row() search
+        at = lst.row(old[0]) if old else lst.count()
+        take = lst.takeItem
+        for _ in old:
+            take(at)
+        lst.insertItems(at, lines)
+        item = lst.item
+        items = [item(i) for i in range(at, at + len(lines))]
+        if items:
+            self._batch_items[folder] = items
 
     # ----------------------------
-    # Asset selection
+    # Background tasks
     # ----------------------------
-    def on_asset_selected(self, current: Optional[QListWidgetItem], previous: Optional[QListWidgetItem]) -> None:
-        self.map_list.clear()
-        self.results_list.clear()
+    def _process_pool(self) -> ProcessPoolExecutor:
+        if self._scan_processes is None:
+            # spawn, not fork: this process already runs Qt and pool threads.
+            # Workers share the image info disk cache when the app uses one
+            cache_path = disk_cache_path()
+            self._scan_processes = ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=enable_disk_cache if cache_path else None,
+                initargs=(cache_path,) if cache_path else (),
+            )
+        return self._scan_processes
+
+    def closeEvent(self, event) -> None:
+        self._watcher.clear()
+        if self._scan_processes is not None:
+            self._scan_processes.shutdown(wait=False, cancel_futures=True)
+            self._scan_processes = None
+        super().closeEvent(event)
+
+    def _start_task(self, on_done, fn, *args, on_progress=None, on_item=None, on_failed=None) -> None:
+        task = Task(fn, *args, report_progress=on_progress is not None, report_items=on_item is not None)
+        task.signals.done.connect(on_done)
+        if on_progress is not None:
+            task.signals.progress.connect(on_progress)
+        if on_item is not None:
+            task.signals.item.connect(on_item)
+        task.signals.failed.connect(on_failed if on_failed is not None else self._on_task_failed)
+        task.signals.finished.connect(self._on_task_finished)
+        self._tasks.add(task)
+        QThreadPool.globalInstance().start(task)
+
+    def _on_task_failed(self, err: str) -> None:
+        # Jobs with no failure handler of their own; batch and export jobs
+        # return their errors in the payload, so this is a bug report
+        self.statusBar().showMessage(f"Background task failed: {err}", 5000)
+
+    def _on_task_finished(self, task: Task) -> None:
+        self._tasks.discard(task)
 
-        if not current:
-            self.asset_header.setText("Select an asset to see its maps.")
+    # ----------------------------
+    # Asset selection
+    # ----------------------------
+    def on_asset_selected(self, current: QModelIndex, previous: QModelIndex) -> None:
+        if self._selected_scan_running:
+            # Only preview rows are listed; _groups still holds the last scan
             return
-
-        asset_name = current.data(Qt.UserRole)
-        group = self._groups.get(asset_name)
+        name = current.data(Qt.UserRole) if current.isValid() else None
+        group = self._groups.get(name) if name else None
         if not group:
+            self.map_model.clear()
+            self.results_model.clear()
             self.asset_header.setText("Select an asset to see its maps.")
             return
-
-        by_type: dict[str, list[str]] = {}
-        for rec in group.textures:
-            if not rec.parsed:
-                continue
-            by_type.setdefault(rec.parsed.map_type, []).append(rec.rel_path)
+        asset_name = group.name
 
         self.asset_header.setText(f"Asset: {group.name} | Parsed textures: {len(group.textures)}")
 
-        for map_type in sorted(by_type.keys(), key=lambda s: s.lower()):
-            self.map_list.addItem(QListWidgetItem(f"{map_type} ({len(by_type[map_type])})"))
-            for rel in by_type[map_type]:
-                child = QListWidgetItem(f"  - {rel}")
-                child.setFlags(child.flags() & ~Qt.ItemIsSelectable)
-                self.map_list.addItem(child)
+        # Built with the scan, so selection only swaps the model's rows
+        self.map_model.set_rows(self._map_rows_by_asset.get(asset_name, []))
 
-        results = self._results_by_asset.get(asset_name, [])
-        if not results:
-            self.results_list.addItem(QListWidgetItem("INFO: No results."))
-        else:
-            for r in results:
-                self.results_list.addItem(QListWidgetItem(f"{r.level}: {r.message}"))
+        # One model reset swaps the old rows for the new
+        self.results_model.set_rows(self._result_rows_by_asset.get(asset_name) or [_NO_RESULTS_ROW])
 
     # ----------------------------
     # Reporting
     # ----------------------------
-    def _build_report(self) -> dict:
-        if not self._root:
-            raise RuntimeError("No folder selected.")
-        return build_report_dict(
-            tool_version=self._tool_version,
-            profile=self._profile.name,
-            groups=self._groups,
-            results_by_asset=self._results_by_asset,
-            unparsed=self._unparsed,
-            autofix_log=self._autofix_log_lines,
-        )
+    def _invalidate_report(self) -> None:
+        # A scan, re-validation or profile change landed
+        self._report_cache = None
+        self._report_builder = None
+
+    def _export_report(self):
+        """
+        The cached report dict, or a builder for it to run on the pool.
+        The builder reads group names, textures and map types, plus the
+        results dicts. Scans replace all of these; re-validation keeps the
+        groups but writes back only the image facts and ORM results they
+        already hold (the same objects), so it is safe from the pool thread.
+        """
+        if self._report_cache is not None:
+            return self._report_cache
+        if self._report_builder is None:
+            self._report_builder = partial(
+                build_report_dict,
+                tool_version=self._tool_version,
+                profile=self._profile.name,
+                groups=self._groups,
+                results_by_asset=self._results_by_asset,
+                unparsed=self._unparsed,
+                # A copy: the live list is cleared when the next scan starts
+                autofix_log=list(self._autofix_log_lines),
+            )
+        return self._report_builder
 
     def on_export_json(self) -> None:
         if not self._root:
             return
-        try:
-            reports_dir = ensure_reports_dir(self._root)
-            out_path = reports_dir / "report.json"
-            report = self._build_report()
-            write_json_report(report, out_path)
-            QMessageBox.information(self, "Export JSON", f"Saved:\n{out_path}")
-        except Exception as e:
-            QMessageBox.critical(self, "Export JSON", f"Failed:\n{e}")
+        self._start_export(
+            "Export JSON", self.export_json_btn, write_json_report, self._export_report(), self._root, "report.json"
+        )
 
     def on_export_html(self) -> None:
         if not self._root:
             return
-        try:
-            reports_dir = ensure_reports_dir(self._root)
-            out_path = reports_dir / "report.html"
-            report = self._build_report()
-            write_html_report(report, out_path)
-            QMessageBox.information(self, "Export HTML", f"Saved:\n{out_path}")
-        except Exception as e:
-            QMessageBox.critical(self, "Export HTML", f"Failed:\n{e}")
+        self._start_export(
+            "Export HTML", self.export_html_btn, write_html_report, self._export_report(), self._root, "report.html"
+        )
 
     def on_export_batch(self) -> None:
         if not self._last_batch_report:
             return
-        try:
-            # Write batch report to the currently selected folder if set; otherwise, home
-            base = self._root if self._root else Path.home()
-            reports_dir = ensure_reports_dir(base)
-            out_path = reports_dir / "batch_report.json"
-            write_batch_json_report(self._last_batch_report, out_path)
-            QMessageBox.information(self, "Export Batch JSON", f"Saved:\n{out_path}")
-        except Exception as e:
-            QMessageBox.critical(self, "Export Batch JSON", f"Failed:\n{e}")
+        # Write batch report to the currently selected folder if set; otherwise, home
+        base = self._root if self._root else Path.home()
+        self._start_export(
+            "Export Batch JSON", self.export_batch_btn, write_batch_json_report,
+            self._last_batch_report, base, "batch_report.json",
+        )
+
+    def _start_export(self, title: str, button: QPushButton, writer, report, base: Path, filename: str) -> None:
+        # Building (if report is a builder), serializing and writing all run
+        # on the pool so big reports don't freeze the window
+        if title in self._export_buttons:
+            return
+        button.setEnabled(False)
+        self._export_buttons[title] = (button, report)
+        self.statusBar().showMessage(f"{title}: writing {filename}...")
+        self._start_task(self._on_export_done, _export_job, title, writer, report, base, filename)
+
+    def _on_export_done(self, payload: tuple) -> None:
+        title, out_path, err, report = payload
+        button, source = self._export_buttons.pop(title)
+        button.setEnabled(True)
+        if report is not None and source is self._report_builder:
+            # Built from the still-current results: the other export reuses it
+            self._report_cache = report
+        self.statusBar().clearMessage()
+        if err:
+            QMessageBox.critical(self, title, f"Failed:\n{err}")
+        else:
+            QMessageBox.information(self, title, f"Saved:\n{out_path}")
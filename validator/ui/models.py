@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from typing import Any, List, Optional, Tuple
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QObject, Qt
+
+# (display text, Qt.UserRole payload, selectable)
+Row = Tuple[str, Any, bool]
+
+# data() and flags() run per row on every repaint, so the enum values are
+# looked up / built once
+_DISPLAY_ROLE = Qt.DisplayRole
+_USER_ROLE = Qt.UserRole
+_SELECTABLE_FLAGS = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+_CHILD_FLAGS = Qt.ItemFlags(Qt.ItemIsEnabled)
+
+
+class RowListModel(QAbstractListModel):
+    """
+    Read-only list model over plain (text, user_data, selectable) tuples.
+    Rows are served on demand, so no per-row item objects are allocated.
+    """
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._rows: List[Row] = []
+
+    def set_rows(self, rows: List[Row]) -> None:
+        # One reset publishes the whole list to the view
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def insert_row(self, position: int, row: Row) -> None:
+        self.beginInsertRows(QModelIndex(), position, position)
+        self._rows.insert(position, row)
+        self.endInsertRows()
+
+    def clear(self) -> None:
+        self.set_rows([])
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        if role == _DISPLAY_ROLE:
+            return row[0]
+        if role == _USER_ROLE:
+            return row[1]
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return _SELECTABLE_FLAGS if self._rows[index.row()][2] else _CHILD_FLAGS
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+from PySide6.QtCore import QFileSystemWatcher, QObject, Signal
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # optional; fall back to QFileSystemWatcher
+    FileSystemEventHandler = object
+    Observer = None
+
+
+class _Handler(FileSystemEventHandler):
+    def __init__(self, watcher: "FolderWatcher") -> None:
+        super().__init__()
+        self._watcher = watcher
+
+    def on_any_event(self, event) -> None:
+        # Observer thread: the signal is queued to the receiver's (GUI) thread
+        if event.event_type in ("opened", "closed", "closed_no_write"):
+            return
+        self._watcher.changed.emit(str(event.src_path))
+        dest = getattr(event, "dest_path", "")
+        if dest:
+            self._watcher.changed.emit(str(dest))
+
+
+class FolderWatcher(QObject):
+    """
+    Watches folder trees and emits changed(path) for anything created,
+    modified, moved or deleted below them.
+
+    Uses one recursive watchdog observer when watchdog is installed, so
+    deep trees need no per-subdirectory watch. Without it, falls back to a
+    QFileSystemWatcher on the top-level folders only.
+    """
+
+    changed = Signal(str)
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._observer = None
+        self._qt_watcher: Optional[QFileSystemWatcher] = None
+        if Observer is None:
+            self._qt_watcher = QFileSystemWatcher(self)
+            self._qt_watcher.directoryChanged.connect(self.changed)
+            self._qt_watcher.fileChanged.connect(self.changed)
+
+    @property
+    def recursive(self) -> bool:
+        return self._qt_watcher is None
+
+    def set_paths(self, folders: Iterable[Path]) -> None:
+        """Replace the watched roots; missing folders are skipped."""
+        self.clear()
+        dirs: List[str] = [str(p) for p in folders if p.exists()]
+        if not dirs:
+            return
+        if self._qt_watcher is not None:
+            self._qt_watcher.addPaths(dirs)
+            return
+        self._observer = Observer()
+        handler = _Handler(self)
+        for d in dirs:
+            self._observer.schedule(handler, d, recursive=True)
+        self._observer.daemon = True
+        self._observer.start()
+
+    def clear(self) -> None:
+        if self._qt_watcher is not None:
+            watched = self._qt_watcher.directories() + self._qt_watcher.files()
+            if watched:
+                self._qt_watcher.removePaths(watched)
+            return
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from typing import Any, Callable
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+
+class TaskSignals(QObject):
+    # Emitted from the pool thread; slots on GUI-thread QObjects run queued
+    done = Signal(object)
+    failed = Signal(str)
+    progress = Signal(int, int)  # (done, total), from fn's progress callback
+    item = Signal(object)  # partial result, from fn's on_item callback
+    finished = Signal(object)  # the Task itself, after done/failed
+
+
+class Task(QRunnable):
+    """
+    Runs fn(*args) on a QThreadPool thread and reports through signals.
+
+    Connect signals.done / signals.failed to bound methods of a GUI-thread
+    QObject (e.g. the main window) so the handlers run on the GUI thread.
+    fn must not touch widgets. Keep a reference to the task until
+    signals.finished fires; the pool does not own the Python object.
+
+    With report_progress=True, fn is also given progress=<callable(done,
+    total)> that emits signals.progress; with report_items=True, it gets
+    on_item=<callable(obj)> that emits signals.item.
+    """
+
+    def __init__(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        report_progress: bool = False,
+        report_items: bool = False,
+    ) -> None:
+        super().__init__()
+        # Python keeps the task alive (see above), so the pool mustn't delete it
+        self.setAutoDelete(False)
+        self.fn = fn
+        self.args = args
+        self.signals = TaskSignals()
+        self.kwargs = {}
+        if report_progress:
+            self.kwargs["progress"] = self.signals.progress.emit
+        if report_items:
+            self.kwargs["on_item"] = self.signals.item.emit
+
+    def run(self) -> None:
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.done.emit(result)
+        self.signals.finished.emit(self)
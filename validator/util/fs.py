@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Union
+
+# Mount types where every directory listing costs a network round trip
+_NETWORK_FS_TYPES = frozenset({"nfs", "nfs4", "cifs", "smb3", "smbfs", "afs", "9p", "ncpfs", "fuse.sshfs"})
+
+_DRIVE_REMOTE = 4  # GetDriveTypeW result for network drives
+
+
+def is_network_path(path: Union[str, Path]) -> bool:
+    """
+    Best-effort check for a folder on a network share: UNC paths and mapped
+    network drives on Windows, NFS/SMB/sshfs mounts on Linux (/proc/mounts).
+    Anything that can't be determined counts as local.
+    """
+    p = os.path.realpath(os.fspath(path))
+    if os.name == "nt":
+        if p.startswith("\\\\"):
+            return True
+        import ctypes
+
+        drive = os.path.splitdrive(p)[0]
+        return bool(drive) and ctypes.windll.kernel32.GetDriveTypeW(drive + "\\") == _DRIVE_REMOTE
+
+    try:
+        with open("/proc/mounts", encoding="utf-8") as f:
+            mounts = [line.split()[1:3] for line in f]
+    except OSError:
+        return False
+
+    # The longest mount point containing p decides its filesystem
+    best, fs_type = "", ""
+    for fields in mounts:
+        if len(fields) != 2:
+            continue
+        mount = fields[0].replace("\\040", " ")
+        if len(mount) > len(best) and (p == mount or p.startswith(mount.rstrip("/") + "/")):
+            best, fs_type = mount, fields[1]
+    return fs_type in _NETWORK_FS_TYPES
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Callable, Iterable, List, Optional, Union
 
 from PIL import Image, UnidentifiedImageError
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ImageInfo:
     width: int
     height: int
@@ -17,49 +20,309 @@ class ImageInfo:
     channels: int
 
 
-def read_image_info(path: Path) -> tuple[Optional[ImageInfo], Optional[str]]:
+_PNG_SIG = b"\x89PNG\r\n\x1a\n"
+
+# Shortest prefix any supported format can be identified by (PNG
+# signature, TIFF/EXR header); anything shorter isn't worth Pillow's probing
+_MIN_HEADER_BYTES = 8
+
+# PNG (bit depth, color type) -> (Pillow mode, channels, has_alpha), per
+# Pillow's PngImagePlugin._MODES. 16-bit grayscale is left to Pillow, whose
+# mode name for it differs between versions
+_PNG_MODES = {
+    (1, 0): ("1", 1, False),
+    (2, 0): ("L", 1, False),
+    (4, 0): ("L", 1, False),
+    (8, 0): ("L", 1, False),
+    (8, 2): ("RGB", 3, False),
+    (16, 2): ("RGB", 3, False),
+    (1, 3): ("P", 1, False),
+    (2, 3): ("P", 1, False),
+    (4, 3): ("P", 1, False),
+    (8, 3): ("P", 1, False),
+    (8, 4): ("LA", 2, True),
+    (16, 4): ("RGBA", 4, True),
+    (8, 6): ("RGBA", 4, True),
+    (16, 6): ("RGBA", 4, True),
+}
+
+# JPEG SOFn markers (C4 = DHT, C8 = JPG, CC = DAC are not frames)
+_JPEG_SOF = frozenset({0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF})
+_JPEG_MODES = {1: ("L", 1), 3: ("RGB", 3), 4: ("CMYK", 4)}
+
+_TIFF_SIGS = (b"II*\x00", b"MM\x00*")
+# Tags read: width, height, bits/sample, photometric, fill order,
+# samples/pixel, extra samples, sample format
+_TIFF_TAGS = frozenset({256, 257, 258, 262, 266, 277, 338, 339})
+_TIFF_TYPE_SIZES = {1: 1, 3: 2, 4: 4}  # BYTE, SHORT, LONG
+_TIFF_TYPE_CODES = {1: "B", 3: "H", 4: "I"}
+# 8-bit (photometric, samples/pixel, extra samples) -> (Pillow mode,
+# channels, has_alpha), per Pillow's TiffImagePlugin.OPEN_INFO; other
+# layouts fall back to Pillow
+_TIFF_MODES = {
+    (0, 1, ()): ("L", 1, False),
+    (1, 1, ()): ("L", 1, False),
+    (1, 2, (2,)): ("LA", 2, True),
+    (2, 3, ()): ("RGB", 3, False),
+    (2, 4, ()): ("RGBA", 4, True),
+    (2, 4, (0,)): ("RGB", 3, False),
+    (2, 4, (1,)): ("RGBA", 4, True),
+    (2, 4, (2,)): ("RGBA", 4, True),
+}
+
+_EXR_MAGIC = b"\x76\x2f\x31\x01"
+_EXR_MULTI_OR_DEEP = 0x800 | 0x1000  # "deep data" / "multipart" version bits
+_EXR_MAX_ATTRS = 64
+_EXR_MAX_ATTR_SIZE = 64 * 1024  # far above any chlist/box2i; guards corrupt sizes
+# EXR channel names -> (mode, channels, has_alpha); Pillow can't open EXR,
+# so the modes mirror the 8-bit equivalents
+_EXR_MODES = {
+    frozenset({"Y"}): ("L", 1, False),
+    frozenset({"Y", "A"}): ("LA", 2, True),
+    frozenset({"R", "G", "B"}): ("RGB", 3, False),
+    frozenset({"R", "G", "B", "A"}): ("RGBA", 4, True),
+}
+
+
+def _png_info(head: bytes) -> Optional[ImageInfo]:
+    # Signature, then IHDR: length, b"IHDR", width, height, depth, color type
+    if len(head) < 26 or head[12:16] != b"IHDR":
+        return None
+    w, h, depth, color_type = struct.unpack(">IIBB", head[16:26])
+    mode = _PNG_MODES.get((depth, color_type))
+    if mode is None:
+        return None
+    return ImageInfo(width=w, height=h, mode=mode[0], format="PNG", has_alpha=mode[2], channels=mode[1])
+
+
+def _jpeg_info(f: BinaryIO) -> Optional[ImageInfo]:
+    # Walk marker segments after SOI until the frame header
+    f.seek(2)
+    while True:
+        b = f.read(1)
+        if not b:
+            return None
+        if b != b"\xff":
+            continue
+        marker = f.read(1)
+        while marker == b"\xff":
+            marker = f.read(1)  # fill bytes before the marker code
+        if not marker:
+            return None
+        m = marker[0]
+        if m == 0x01 or 0xD0 <= m <= 0xD7:
+            continue  # standalone marker
+        if m in (0xD9, 0xDA):
+            return None  # EOI / SOS before any frame header
+        seg = f.read(2)
+        if len(seg) < 2:
+            return None
+        (length,) = struct.unpack(">H", seg)
+        if length < 2:
+            return None  # corrupt; would seek backwards
+        if m in _JPEG_SOF:
+            frame = f.read(6)
+            if len(frame) < 6:
+                return None
+            _, h, w, n = struct.unpack(">BHHB", frame)
+            mode = _JPEG_MODES.get(n)
+            if mode is None or not w or not h:
+                return None
+            return ImageInfo(width=w, height=h, mode=mode[0], format="JPEG", has_alpha=False, channels=mode[1])
+        f.seek(length - 2, 1)
+
+
+def _tiff_info(f: BinaryIO, head: bytes) -> Optional[ImageInfo]:
+    # First IFD only, as Pillow reports; 8-bit unsigned samples only
+    order = "<" if head[:2] == b"II" else ">"
+    (ifd,) = struct.unpack(order + "I", head[4:8])
+    f.seek(ifd)
+    (count,) = struct.unpack(order + "H", f.read(2))
+    entries = f.read(12 * count)
+
+    tags = {}
+    for i in range(0, len(entries) - 11, 12):
+        tag, typ, n = struct.unpack(order + "HHI", entries[i:i + 8])
+        if tag not in _TIFF_TAGS:
+            continue
+        size = _TIFF_TYPE_SIZES.get(typ)
+        if size is None:
+            return None
+        raw = entries[i + 8:i + 8 + size * n] if size * n <= 4 else None
+        if raw is None:
+            (offset,) = struct.unpack(order + "I", entries[i + 8:i + 12])
+            pos = f.tell()
+            f.seek(offset)
+            raw = f.read(size * n)
+            f.seek(pos)
+        tags[tag] = struct.unpack(f"{order}{n}{_TIFF_TYPE_CODES[typ]}", raw)
+
+    w, h = tags.get(256, (0,))[0], tags.get(257, (0,))[0]
+    photometric = tags.get(262, (None,))[0]
+    spp = tags.get(277, (1,))[0]
+    bits = tags.get(258, (1,))
+    if (
+        not w or not h
+        or tags.get(266, (1,))[0] != 1
+        or any(v != 1 for v in tags.get(339, (1,)))
+        or len(bits) not in (1, spp)
+        or any(b != 8 for b in bits)
+    ):
+        return None
+    mode = _TIFF_MODES.get((photometric, spp, tags.get(338, ())))
+    if mode is None:
+        return None
+    return ImageInfo(width=w, height=h, mode=mode[0], format="TIFF", has_alpha=mode[2], channels=mode[1])
+
+
+def _exr_info(f: BinaryIO) -> Optional[ImageInfo]:
+    # Single-part scanline/tiled header: name\0 type\0 size value ..., ended by \0
+    f.seek(4)
+    (version,) = struct.unpack("<I", f.read(4))
+    if version & _EXR_MULTI_OR_DEEP:
+        return None
+    names: Optional[list[str]] = None
+    window = None
+    for _ in range(_EXR_MAX_ATTRS):
+        name = _read_cstr(f)
+        if not name:
+            break
+        _read_cstr(f)  # attribute type
+        (size,) = struct.unpack("<I", f.read(4))
+        if size > _EXR_MAX_ATTR_SIZE:
+            return None
+        value = f.read(size)
+        if len(value) != size:
+            return None  # truncated header
+        if name == b"channels":
+            # Each channel: name\0 + 16 bytes (type, pLinear, reserved, sampling)
+            names = []
+            pos = 0
+            while pos < len(value) and value[pos]:
+                end = value.index(b"\0", pos)
+                names.append(value[pos:end].decode("ascii", "replace"))
+                pos = end + 17
+        elif name == b"dataWindow":
+            window = struct.unpack("<iiii", value)
+        if names is not None and window is not None:
+            break
+    if names is None or window is None:
+        return None
+
+    mode = _EXR_MODES.get(frozenset(names))
+    if mode is None:
+        return None
+    xmin, ymin, xmax, ymax = window
+    return ImageInfo(
+        width=xmax - xmin + 1, height=ymax - ymin + 1, mode=mode[0], format="EXR", has_alpha=mode[2], channels=mode[1]
+    )
+
+
+def _read_cstr(f: BinaryIO) -> bytes:
+    out = bytearray()
+    while len(out) < 256:
+        b = f.read(1)
+        if not b or b == b"\0":
+            break
+        out += b
+    return bytes(out)
+
+
+class _TooShort(Exception):
+    """The file ends before any supported image header could."""
+
+
+def _read_header_info(path: Union[str, Path]) -> Optional[ImageInfo]:
+    """
+    Parse PNG/JPEG/TIFF/EXR headers directly, skipping Pillow's plugin
+    probing. Returns None for anything else so the caller falls back to
+    Pillow; raises _TooShort for empty / truncated placeholder files,
+    which Pillow would only fail on more slowly.
+    """
+    try:
+        with open(path, "rb") as f:
+            head = f.read(33)
+            if len(head) < _MIN_HEADER_BYTES:
+                raise _TooShort(len(head))
+            if head.startswith(_PNG_SIG):
+                return _png_info(head)
+            if head.startswith(b"\xff\xd8"):
+                return _jpeg_info(f)
+            if head[:4] in _TIFF_SIGS:
+                return _tiff_info(f, head)
+            if head.startswith(_EXR_MAGIC):
+                return _exr_info(f)
+    except (OSError, struct.error, ValueError):
+        return None
+    return None
+
+
+def read_image_info(path: Union[str, Path]) -> tuple[Optional[ImageInfo], Optional[str]]:
     """
     Reads lightweight metadata with Pillow.
     Returns (ImageInfo|None, error_message|None).
+
+    Only the header is parsed: PNG, JPEG and 8-bit TIFF headers and common
+    EXR channel layouts are read directly, everything else via Image.open()
+    without load()/convert(), so no pixel data is decoded. Files too short
+    to hold any header are reported without trying Pillow.
     """
+    try:
+        info = _read_header_info(path)
+    except _TooShort as e:
+        size = e.args[0]
+        return None, "Empty file (0 bytes)." if size == 0 else f"Truncated file ({size} bytes)."
+    if info is not None:
+        return info, None
+
     try:
         with Image.open(path) as img:
             w, h = img.size
             mode = img.mode or ""
             fmt = (img.format or "").upper()
 
-            # Determine channels/alpha from mode
-            # Common: L(1), RGB(3), RGBA(4)
-            ch = 0
-            has_alpha = False
-            if mode == "L":
-                ch = 1
-            elif mode == "LA":
-                ch = 2
-                has_alpha = True
-            elif mode == "RGB":
-                ch = 3
-            elif mode == "RGBA":
-                ch = 4
-                has_alpha = True
-            else:
-                # Best-effort: count bands
-                try:
-                    ch = len(img.getbands())
-                    has_alpha = "A" in img.getbands()
-                except Exception:
-                    ch = 0
+            # Bands derive from the mode alone: L(1), LA(2), RGB(3), RGBA(4), ...
+            try:
+                bands = img.getbands()
+            except Exception:
+                bands = ()
 
             return ImageInfo(
                 width=w,
                 height=h,
                 mode=mode,
                 format=fmt,
-                has_alpha=has_alpha,
-                channels=ch,
+                has_alpha="A" in bands,
+                channels=len(bands),
             ), None
 
     except UnidentifiedImageError:
         return None, "Unsupported image format (Pillow could not identify file)."
     except Exception as e:
         return None, f"Failed to read image metadata: {e}"
+
+
+def read_image_info_batch(
+    paths: Iterable[Union[str, Path]],
+    max_workers: Optional[int] = None,
+    use_processes: bool = False,
+    reader: Optional[Callable[[Union[str, Path]], tuple[Optional[ImageInfo], Optional[str]]]] = None,
+) -> List[tuple[Optional[ImageInfo], Optional[str]]]:
+    """
+    read_image_info() (or reader, e.g. a cached variant) for many files at
+    once, results in input order.
+
+    Threads (the default) overlap the file opens, which is what matters on
+    network shares; use_processes=True suits files that mostly fall back
+    to Pillow's CPU-heavier parsing.
+    """
+    reader = reader or read_image_info
+    paths = list(paths)
+    if not paths:
+        return []
+    workers = min(max_workers or min(32, (os.cpu_count() or 1) * 4), len(paths))
+    if use_processes:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(reader, paths, chunksize=max(1, len(paths) // (workers * 4))))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(reader, paths))
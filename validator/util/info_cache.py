@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+from typing import Optional, Union
+
+from validator.util.image_info import ImageInfo, read_image_info
+
+try:
+    import platformdirs  # optional, picks the per-OS cache folder
+except ImportError:
+    platformdirs = None
+
+_APP_NAME = "texture-pack-validator"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS image_info (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    width INTEGER NOT NULL,
+    height INTEGER NOT NULL,
+    mode TEXT NOT NULL,
+    format TEXT NOT NULL,
+    has_alpha INTEGER NOT NULL,
+    channels INTEGER NOT NULL
+)
+"""
+
+
+def default_cache_path() -> Path:
+    if platformdirs is not None:
+        base = Path(platformdirs.user_cache_dir(_APP_NAME, appauthor=False))
+    elif sys.platform == "win32":
+        base = Path(os.environ.get("LOCALAPPDATA", Path.home())) / _APP_NAME / "Cache"
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Caches" / _APP_NAME
+    else:
+        base = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / _APP_NAME
+    return base / "image_info.sqlite3"
+
+
+class ImageInfoCache:
+    """
+    Persistent read_image_info() results in SQLite, one row per file,
+    valid while the file's (mtime_ns, size) is unchanged. A changed file
+    is simply read again and its row replaced.
+
+    Only successful reads are stored, so a transient failure (share
+    offline, file mid-copy) is retried next time. Thread-safe; any SQLite
+    error just means a normal read.
+    """
+
+    def __init__(self, db_path: Union[str, Path]) -> None:
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        # Autocommit + WAL: each insert is cheap and other processes
+        # (Scan All workers) can read while one writes
+        self._conn = sqlite3.connect(self.db_path, timeout=5, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+
+    def read(self, path: Union[str, Path]) -> tuple[Optional[ImageInfo], Optional[str]]:
+        path_str = os.fspath(path)
+        try:
+            st = os.stat(path_str)
+        except OSError:
+            return read_image_info(path_str)
+
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT width, height, mode, format, has_alpha, channels FROM image_info"
+                    " WHERE path = ? AND mtime_ns = ? AND size = ?",
+                    (path_str, st.st_mtime_ns, st.st_size),
+                ).fetchone()
+        except sqlite3.Error:
+            row = None
+        if row is not None:
+            w, h, mode, fmt, has_alpha, channels = row
+            return ImageInfo(width=w, height=h, mode=mode, format=fmt, has_alpha=bool(has_alpha), channels=channels), None
+
+        info, err = read_image_info(path_str)
+        if info is not None:
+            try:
+                with self._lock:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO image_info VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (path_str, st.st_mtime_ns, st.st_size, info.width, info.height,
+                         info.mode, info.format, int(info.has_alpha), info.channels),
+                    )
+            except sqlite3.Error:
+                pass
+        return info, err
+
+    def prune(self) -> int:
+        """
+        Drop rows for files that no longer exist; returns how many.
+
+        A file only counts as deleted when its folder can be listed: rows
+        under a folder that is unreachable right now (share offline, drive
+        unplugged) are kept. Uses its own connection, so it can run on a
+        background thread while the cache is in use or being closed.
+        """
+        conn = sqlite3.connect(self.db_path, timeout=5, isolation_level=None)
+        try:
+            paths = [p for (p,) in conn.execute("SELECT path FROM image_info")]
+            reachable: dict[str, bool] = {}
+            gone = []
+            for p in paths:
+                if os.path.exists(p):
+                    continue
+                parent = os.path.dirname(p)
+                ok = reachable.get(parent)
+                if ok is None:
+                    ok = reachable[parent] = os.path.isdir(parent)
+                if ok:
+                    gone.append((p,))
+            if gone:
+                conn.executemany("DELETE FROM image_info WHERE path = ?", gone)
+            return len(gone)
+        finally:
+            conn.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_active: Optional[ImageInfoCache] = None
+
+
+def enable_disk_cache(db_path: Union[str, Path, None] = None) -> Optional[ImageInfoCache]:
+    """
+    Route read_image_info_cached() through a persistent cache at db_path
+    (default_cache_path() when None). Off by default; returns None and
+    stays off if the cache can't be opened.
+    """
+    global _active
+    disable_disk_cache()
+    try:
+        _active = ImageInfoCache(db_path or default_cache_path())
+    except (OSError, sqlite3.Error):
+        _active = None
+    return _active
+
+
+def disable_disk_cache() -> None:
+    global _active
+    if _active is not None:
+        _active.close()
+        _active = None
+
+
+def disk_cache_path() -> Optional[Path]:
+    """Database of the enabled disk cache, or None when it is off."""
+    cache = _active
+    return cache.db_path if cache is not None else None
+
+
+def read_image_info_cached(path: Union[str, Path]) -> tuple[Optional[ImageInfo], Optional[str]]:
+    """read_image_info(), served from the disk cache when it is enabled."""
+    cache = _active
+    if cache is None:
+        return read_image_info(path)
+    return cache.read(path)
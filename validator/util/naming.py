@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-from typing import Optional, Tuple
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Optional, Tuple
 
 # Canonical map types we support (Day 2)
 CANON_MAPS = {
@@ -55,36 +57,40 @@ ALIASES = {
     "displacement": "Height",
 }
 
-_VERSION_RE = re.compile(r"^(?P<base>.+)_(?:v|V)(?P<ver>\d{3,})$", re.IGNORECASE)
+# Every accepted lowercase token (aliases and canonical spellings) -> canonical
+_LOOKUP: Mapping[str, str] = MappingProxyType({**ALIASES, **{m.lower(): m for m in CANON_MAPS}})
+_LOOKUP_GET = _LOOKUP.get
 
+# Compiled once: used per distinct stem / map token
+_VERSION_RE = re.compile(r"^(?P<base>.*)_[vV](?P<ver>\d{3,})$")
+_DUP_SUFFIX_RE = re.compile(r"\s*\(\d+\)\s*$")
+_NOISE_SUFFIX_RE = re.compile(r"[-\s]*(copy|final|export)\s*$")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ParsedName:
     asset: str
     map_type: str
     version: Optional[int]
     raw_map_token: str
 
+@lru_cache(maxsize=1024)
 def canonicalize_map_token(token: str) -> Optional[str]:
+    # Memoized: the same few tokens recur across every asset
     t = token.strip().lower()
-    if not t:
-        return None
+    # Clean tokens are the norm; only the rest pay for the noise stripping
+    canon = _LOOKUP_GET(t)
+    if canon is not None or not t:
+        return canon
 
     # Strip common suffix noise: "roughness (1)", "roughness_copy", "roughness-final"
-    t = re.sub(r"\s*\(\d+\)\s*$", "", t)         # trailing (1)
-    t = re.sub(r"[-\s]*(copy|final|export)\s*$", "", t)  # trailing copy/final/export
+    t = _DUP_SUFFIX_RE.sub("", t)  # trailing (1)
+    t = _NOISE_SUFFIX_RE.sub("", t)  # trailing copy/final/export
     t = t.replace(" ", "")  # allow "ambient occlusion"
 
-    canon = ALIASES.get(t)
-    if canon:
-        return canon
-
-    for m in CANON_MAPS:
-        if t == m.lower():
-            return m
-
-    return None
+    return _LOOKUP_GET(t)
 
+@lru_cache(maxsize=65536)
 def parse_texture_filename(stem: str) -> Tuple[Optional[ParsedName], Optional[str]]:
     """
     Parse filenames like:
@@ -92,31 +98,26 @@ def parse_texture_filename(stem: str) -> Tuple[Optional[ParsedName], Optional[st
       Asset_MapType_v###     (version optional)
 
     Returns: (ParsedName | None, error_message | None)
+
+    Memoized by stem: results are immutable and stems repeat across
+    folders / rescans.
     """
-    parts = stem.split("_")
-    if len(parts) < 2:
+    asset, sep, map_token = stem.rpartition("_")
+    if not sep:
         return None, "No '_' separator found (expected Asset_MapType[_v###])."
 
     version: Optional[int] = None
 
     # Case: ..._MapType_v###
-    last = parts[-1]
-    if last.lower().startswith("v") and last[1:].isdigit() and len(last) >= 4:
+    m = _VERSION_RE.match(stem)
+    if m:
         # Need at least Asset, MapType, v###
-        if len(parts) < 3:
+        asset, sep, map_token = m.group("base").rpartition("_")
+        if not sep:
             return None, "Version suffix present but missing map type (expected Asset_MapType_v###)."
+        version = int(m.group("ver"))
 
-        try:
-            version = int(last[1:])
-        except ValueError:
-            return None, "Version suffix could not be parsed."
-
-        map_token = parts[-2]
-        asset = "_".join(parts[:-2]).strip()
-    else:
-        # Case: ..._MapType
-        map_token = parts[-1]
-        asset = "_".join(parts[:-1]).strip()
+    asset = asset.strip()
 
     if not asset:
         return None, "Asset name was empty."